@@ -8,6 +8,10 @@ import tkinter.font as tkFont
 from datetime import datetime
 import os
 import sys
+import csv
+import textwrap
+from bisect import bisect_left
+from collections import namedtuple
 
 def get_base_path():
     """Get the base path for the application (works with both .py and .exe)"""
@@ -33,16 +37,133 @@ try:
 except ImportError:
     DOCX_AVAILABLE = False
 
-class BIDOptimized:        
-        # Save Risk Assessment Data
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    risk_filename = f"BID_Risk_Assessment_{timestamp}.csv"
-        
-        # Create Output directory if it doesn't exist
-    output_dir = os.path.join(get_base_path(), "Output")
-    os.makedirs(output_dir, exist_ok=True)
-        
-    risk_filepath = os.path.join(output_dir, risk_filename)   # Configuration data
+# Predefined weight of each category in the Risk Assessment table
+CATEGORY_WEIGHTS = {
+    "Cybersecurity Requirements": 0.15,
+    "Security Architecture Constraints": 0.12,
+    "Cryptographic Requirements": 0.10,
+    "Authentication & Access Control": 0.08,
+    "Supply Chain Security": 0.12,
+    "Threat Modeling Guidelines": 0.08,
+    "Security Compliance References": 0.07,
+    "Security Validation Requirements": 0.10,
+    "Incident Response Expectations": 0.05,
+    "Data Protection and Privacy": 0.07,
+    "Cybersecurity Historical Data": 0.06
+}
+
+# Table 1 data (Score Matrix) - Removed Weight column
+TABLE1_DATA = [
+    ["Category", "Score 1 (Low)", "Score 2 (Significative)", "Score 3 (Moderate)", "Score 4 (High)"],
+    ["Cybersecurity Requirements", "Clear, specific CIA objectives and mapped controls", "Partial objectives, general security references", "Vague mention of cybersecurity without clear objectives", "No security objectives mentioned"],
+    ["Security Architecture Constraints", "Defined secure architecture, protocols and constraints", "General reference to secure design without details", "Weak constraints, non-binding suggestions", "No architectural constraints present"],
+    ["Cryptographic Requirements", "Detailed crypto specs (e.g. AES256, PKI), lifecycle defined", "Crypto required but not specified", "Crypto mentioned vaguely, unclear implementation strategy", "No mention of encryption or key management"],
+    ["Authentication & Access Control", "Clear roles, access policies, identity/authentication methods", "Generic role-based access noted", "Some access control logic implied but no detail", "No mention of access control or identity management"],
+    ["Supply Chain Security", "Trusted suppliers required, integrity checks mandated", "Supplier lists validated but not verified", "Open supplier selection, no trust/integrity verification", "No supply chain considerations present"],
+    ["Threat Modeling Guidelines", "Threat model provided or referenced", "Reference to general threat types", "High-level mention of risk environment", "No threat modeling or attack surface identified"],
+    ["Security Compliance References", "Full list of mandatory compliance standards", "Some standards listed, not mandatory", "Mentioned standards optional or vague", "No standards or frameworks referenced"],
+    ["Security Validation Requirements", "Detailed validation strategy including scope and responsibility", "Validation required but not detailed", "Unclear expectations for testing/audits", "No mention of security validation"],
+    ["Incident Response Expectations", "Incident response roles, deadlines, escalation paths defined", "Some response actions outlined", "Minimal requirements for incident handling", "No incident response planning mentioned"],
+    ["Data Protection and Privacy", "Full compliance expectations and procedures included", "Compliance mentioned but procedures vague", "Compliance cited but not related to mission data", "No mention of data protection or privacy"],
+    ["Cybersecurity Historical Data", "Documented past incidents and mitigation strategies provided", "General lessons learned included", "Incomplete data or single example used", "No historical data on cybersecurity issues"]
+]
+
+# Table 2 data (Risk Assessment) - Keep Weight column
+TABLE2_DATA = [
+    ["Category", "Value (1-4)", "Weight", "Inapplicability"],
+    *[[row[0], "", f"{CATEGORY_WEIGHTS.get(row[0], 0.0):.2f}", ""] for row in TABLE1_DATA[1:]]
+]
+
+# Numeric weights aligned with TABLE2_DATA rows, as displayed in the Weight column
+WEIGHTS = tuple(CATEGORY_WEIGHTS.get(row[0], 0.0) for row in TABLE1_DATA[1:])
+# Original weights redistributed by update_weight_value when inapplicability changes
+# (its last two entries differ from the displayed CATEGORY_WEIGHTS)
+REDISTRIBUTION_WEIGHTS = (0.15, 0.12, 0.1, 0.08, 0.12, 0.08, 0.07, 0.1, 0.05, 0.06, 0.07)
+
+# Table 3 data (Results)
+TABLE3_DATA = [
+    ["Total Score", "Risk Level"], 
+    ["0.000", "Very Low"],
+    ["Score Range", "Level"],  # Sub-header
+    ["0-0.1", "Very Low"], 
+    ["0.1-0.4", "Low"], 
+    ["0.4-0.7", "Medium"], 
+    ["0.7-0.9", "High"], 
+    ["0.9-1", "Very High"]
+]
+
+# Risk level colors
+RISK_COLORS = {
+    'Very Low': ('#f8f9fa', '#6c757d'),
+    'Low': ('#d4edda', '#155724'),
+    'Medium': ('#fff3cd', '#856404'), 
+    'High': ('#f8d7da', '#721c24'),
+    'Very High': ('#dc3545', '#ffffff')
+}
+
+# Risk levels by increasing score, with the inclusive upper score bound of every level but the last
+RISK_THRESHOLDS = (0.09, 0.39, 0.69, 0.89)
+# (label, background, foreground) of each level, indexed by the threshold search
+RISK_LEVEL_TABLE = tuple((level, *RISK_COLORS[level])
+                         for level in ("Very Low", "Low", "Medium", "High", "Very High"))
+
+def compute_total_score(values, weights):
+    """Weighted BID score: sum of (value - 1) * weight / 3 over all categories (values 1-4)"""
+    return sum((value - 1) * weight / 3 for value, weight in zip(values, weights))
+
+# Write buffer for CSV exports (rows are written in one batch)
+CSV_BUFFER_SIZE = 1 << 16
+
+# Quiet period (ms) before the score is recomputed after a burst of value/weight changes
+UPDATE_DEBOUNCE_MS = 40
+
+# Tool explanation shown below the criteria table in the help window
+HELP_EXPLANATION_TEXT = """The BID (Bid Phase) Risk Assessment Tool helps evaluate cybersecurity risks during the bidding phase of space projects. Here's how to use it:
+
+1. EVALUATION PROCESS:
+   • For each of the 11 cybersecurity criteria, assess the quality of requirements in the ITT (Invitation to Tender)
+   • Rate each criterion from 1 to 4 based on how well it is defined in the tender documents:
+     - Score 1 (Low Risk): Well-defined, detailed requirements with clear specifications
+     - Score 2 (Significative Risk): Partially defined with some details but lacking specificity
+     - Score 3 (Moderate Risk): Vague or unclear requirements with minimal guidance
+     - Score 4 (High Risk): No mention or very poor definition of the requirement
+
+2. WEIGHTING SYSTEM:
+   • Each criterion has a predefined weight based on its importance to overall cybersecurity
+   • Higher weights are assigned to more critical security aspects like:
+     - Cybersecurity Requirements (15%)
+     - Security Architecture Constraints (12%)
+     - Supply Chain Security (12%)
+
+3. INAPPLICABILITY OPTION:
+   • If a criterion is not applicable to the specific project, check the "Inapplicability" box
+   • The tool will automatically redistribute that criterion's weight among the remaining applicable criteria
+   • This ensures the assessment remains accurate for the project's specific context
+
+4. AUTOMATIC CALCULATION:
+   • The tool calculates a total risk score using the formula: Σ((Score-1) × Weight / 3)
+   • This normalizes scores to a 0-1 scale where:
+     - 0.0-0.1: Very Low Risk
+     - 0.1-0.4: Low Risk
+     - 0.4-0.7: Medium Risk
+     - 0.7-0.9: High Risk
+     - 0.9-1.0: Very High Risk
+
+5. RESULTS INTERPRETATION:
+   • Higher scores indicate greater cybersecurity risk due to poorly defined requirements
+   • Use this assessment to:
+     - Identify areas requiring clarification during the bidding process
+     - Estimate additional effort needed for cybersecurity implementation
+     - Make informed go/no-go decisions on tender participation
+     - Plan appropriate cybersecurity measures and resources
+
+6. EXPORT FUNCTIONALITY:
+   • Save your assessment as a Word document for documentation and reporting
+   • The export includes all evaluation details, scores, and risk analysis results"""
+
+class BIDOptimized:
+    # Set once the Output directory has been created, so later saves skip the check
+    _output_dir_ready = False
     
     COLORS = {
         'primary': '#4a90c2', 'secondary': '#dc3545', 'success': '#28a745',
@@ -51,58 +172,8 @@ class BIDOptimized:
         'yellow': '#fff3cd', 'red': '#f8d7da', 'dark_red': '#dc3545'
     }
     
-    # Table 1 data (Score Matrix) - Removed Weight column
-    TABLE1_DATA = [
-        ["Category", "Score 1 (Low)", "Score 2 (Significative)", "Score 3 (Moderate)", "Score 4 (High)"],
-        ["Cybersecurity Requirements", "Clear, specific CIA objectives and mapped controls", "Partial objectives, general security references", "Vague mention of cybersecurity without clear objectives", "No security objectives mentioned"],
-        ["Security Architecture Constraints", "Defined secure architecture, protocols and constraints", "General reference to secure design without details", "Weak constraints, non-binding suggestions", "No architectural constraints present"],
-        ["Cryptographic Requirements", "Detailed crypto specs (e.g. AES256, PKI), lifecycle defined", "Crypto required but not specified", "Crypto mentioned vaguely, unclear implementation strategy", "No mention of encryption or key management"],
-        ["Authentication & Access Control", "Clear roles, access policies, identity/authentication methods", "Generic role-based access noted", "Some access control logic implied but no detail", "No mention of access control or identity management"],
-        ["Supply Chain Security", "Trusted suppliers required, integrity checks mandated", "Supplier lists validated but not verified", "Open supplier selection, no trust/integrity verification", "No supply chain considerations present"],
-        ["Threat Modeling Guidelines", "Threat model provided or referenced", "Reference to general threat types", "High-level mention of risk environment", "No threat modeling or attack surface identified"],
-        ["Security Compliance References", "Full list of mandatory compliance standards", "Some standards listed, not mandatory", "Mentioned standards optional or vague", "No standards or frameworks referenced"],
-        ["Security Validation Requirements", "Detailed validation strategy including scope and responsibility", "Validation required but not detailed", "Unclear expectations for testing/audits", "No mention of security validation"],
-        ["Incident Response Expectations", "Incident response roles, deadlines, escalation paths defined", "Some response actions outlined", "Minimal requirements for incident handling", "No incident response planning mentioned"],
-        ["Data Protection and Privacy", "Full compliance expectations and procedures included", "Compliance mentioned but procedures vague", "Compliance cited but not related to mission data", "No mention of data protection or privacy"],
-        ["Cybersecurity Historical Data", "Documented past incidents and mitigation strategies provided", "General lessons learned included", "Incomplete data or single example used", "No historical data on cybersecurity issues"]
-    ]
-    
-    # Table 2 data (Risk Assessment) - Keep Weight column
-    TABLE2_DATA = [
-        ["Category", "Value (1-4)", "Weight", "Inapplicability"],
-        *[[row[0], "", "0.15" if row[0] == "Cybersecurity Requirements" else 
-           "0.12" if row[0] == "Security Architecture Constraints" else
-           "0.10" if row[0] == "Cryptographic Requirements" else
-           "0.08" if row[0] == "Authentication & Access Control" else
-           "0.12" if row[0] == "Supply Chain Security" else
-           "0.08" if row[0] == "Threat Modeling Guidelines" else
-           "0.07" if row[0] == "Security Compliance References" else
-           "0.10" if row[0] == "Security Validation Requirements" else
-           "0.05" if row[0] == "Incident Response Expectations" else
-           "0.07" if row[0] == "Data Protection and Privacy" else
-           "0.06" if row[0] == "Cybersecurity Historical Data" else "0.00", ""] for row in TABLE1_DATA[1:]]
-    ]
-    
-    # Table 3 data (Results)
-    TABLE3_DATA = [
-        ["Total Score", "Risk Level"], 
-        ["0.000", "Very Low"],
-        ["Score Range", "Level"],  # Sub-header
-        ["0-0.1", "Very Low"], 
-        ["0.1-0.4", "Low"], 
-        ["0.4-0.7", "Medium"], 
-        ["0.7-0.9", "High"], 
-        ["0.9-1", "Very High"]
-    ]
-    
-    # Risk level colors
-    RISK_COLORS = {
-        'Very Low': ('#f8f9fa', '#6c757d'),
-        'Low': ('#d4edda', '#155724'),
-        'Medium': ('#fff3cd', '#856404'), 
-        'High': ('#f8d7da', '#721c24'),
-        'Very High': ('#dc3545', '#ffffff')
-    }
+    # Same colors with attribute access, used by the per-cell table code
+    PALETTE = namedtuple('Palette', COLORS)(**COLORS)
     
     # Criteria descriptions for help window
     CRITERIA_DESCRIPTIONS = {
@@ -123,6 +194,23 @@ class BIDOptimized:
         self.root = root
         self.root.title("BID Phase")
         self.setup_scaling()
+        self.current_weights = list(WEIGHTS)
+        self.current_values = [1.0] * len(WEIGHTS)  # Value (1-4) of each category, kept in sync by traces
+        self._value_index = {}  # Tcl variable name -> category index
+        self._check_index = {}  # Tcl variable name -> category index
+        self._checked = [False] * len(WEIGHTS)  # Inapplicability state of each category
+        self._checked_weight_sum = 0.0  # Total original weight of the inapplicable categories
+        self._unchecked_count = len(WEIGHTS)
+        self._weight_texts = [row[2] for row in TABLE2_DATA[1:]]  # Weight text currently displayed
+        self._category_names = [row[0] for row in TABLE2_DATA[1:]]  # Static category column, read without Tk
+        self._font_cache = {}  # Font objects reused when measuring cell text
+        self._update_after_id = None  # Pending debounced score recalculation, if any
+        self._weights_dirty = False  # True when weight cells must be rewritten on the next refresh
+        self._last_score_state = None  # (values, weights) behind the total score currently displayed
+        self._risk_level_index = None  # RISK_LEVEL_TABLE index currently displayed (None until first update)
+        self._saving = False  # True from the save click until the export has finished
+        self._help_window = None  # Built on first open, then hidden and reused
+        self._help_canvas = None  # Scrolled by the 'HelpScroll' mouse wheel binding
         self.setup_ui()
         self.create_tables()
         self.update_total_score()
@@ -152,6 +240,15 @@ class BIDOptimized:
         self.scaled_padding = max(5, int(8 * self.scale_factor))
         self.scaled_button_padding = max(15, int(20 * self.scale_factor))
         self.scaled_cell_height = max(20, int(25 * self.scale_factor))
+        
+        # Table cell fonts, built once and shared by every cell
+        self._FONTS = {
+            'header': ('Segoe UI', self.scaled_font_size, 'bold'),
+            'header_mono': ('Consolas', self.scaled_font_size, 'bold'),
+            'data': ('Segoe UI', self.scaled_font_size - 1, 'normal'),
+            'data_bold': ('Segoe UI', self.scaled_font_size - 1, 'bold'),
+            'combo': ('Segoe UI', self.scaled_font_size - 1)
+        }
 
     def disable_mousewheel_on_combobox(self, combo):
         """Disable mouse wheel on combobox to prevent accidental value changes while allowing page scroll"""
@@ -194,7 +291,7 @@ class BIDOptimized:
         scrollbar_h = tk.Scrollbar(self.root, orient="horizontal", command=self.canvas.xview)
         
         self.main_frame = tk.Frame(self.canvas, bg=self.COLORS['white'])
-        self.main_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+        self.main_frame.bind("<Configure>", self._on_frame_configure)
         
         self.canvas.create_window((0, 0), window=self.main_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=scrollbar_v.set, xscrollcommand=scrollbar_h.set)
@@ -208,6 +305,10 @@ class BIDOptimized:
         self.canvas.bind_all("<MouseWheel>", lambda e: self.canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
         self.canvas.bind_all("<Shift-MouseWheel>", lambda e: self.canvas.xview_scroll(int(-1*(e.delta/120)), "units"))
 
+    def _on_frame_configure(self, event=None):
+        """Update the canvas scroll region to the content size"""
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
     def create_modern_entry(self, parent, **kwargs):
         """Create modern styled entry widget"""
         defaults = {
@@ -223,83 +324,78 @@ class BIDOptimized:
         entry.bind('<FocusOut>', lambda e: entry.configure(highlightcolor=self.COLORS['primary']))
         return entry
 
-    def create_table(self, parent, title, data, color, interactive=False):
+    def create_table(self, parent, title, data, color, col_min_widths, interactive=False):
         """Generic table creation function"""
-        container = tk.Frame(parent, bg=self.COLORS['white'])
+        palette = self.PALETTE
+        container = tk.Frame(parent, bg=palette.white)
         
         frame = tk.LabelFrame(container, text=title,
                              font=('Segoe UI', self.scaled_font_size + 2, 'bold'),
-                             bg=self.COLORS['white'], fg=color, padx=25, pady=20,
+                             bg=palette.white, fg=color, padx=25, pady=20,
                              relief='ridge', bd=2, labelanchor='n')
         frame.pack(fill='both', expand=True)
         
         cells = []
-        combo_vars, check_vars = [], []
+        combo_vars, check_vars = [], []  # Flat, one entry per data row (interactive tables only)
+        measurable = [[] for _ in data[0]]  # (text, font) of Entry cells, per column
         
         for i, row in enumerate(data):
-            cell_row, combo_row, check_row = [], [], []
+            cell_row = []
             
             for j, text in enumerate(row):
                 # Handle interactive elements for table 2
                 if interactive and i > 0 and j == 1:  # ComboBox column
                     combo_var = tk.StringVar(value='1')
+                    self._value_index[str(combo_var)] = len(combo_vars)
+                    combo_var.trace_add('write', self._on_value_changed)
                     combo = ttk.Combobox(frame, textvariable=combo_var, values=['1', '2', '3', '4'],
-                                       state='readonly', width=8, font=('Segoe UI', self.scaled_font_size - 1))
-                    combo.bind('<<ComboboxSelected>>', self.update_total_score)
+                                       state='readonly', width=8, font=self._FONTS['combo'])
                     self.disable_mousewheel_on_combobox(combo)  # Prevent accidental value changes
                     combo.grid(row=i, column=j, padx=3, pady=3, sticky='ew', ipady=7)
                     cell_row.append(combo)
-                    combo_row.append(combo_var)
-                    check_row.append(None)
+                    combo_vars.append(combo_var)
                     
                 elif interactive and i > 0 and j == 2:  # Weight column
-                    weight_cell = self.create_table_cell(frame, i, j, text, color, title)
+                    weight_cell = self.create_table_cell(frame, i, j, text, color, title, measurable)
                     weight_cell.grid(row=i, column=j, padx=3, pady=self.get_cell_pady(i, title), 
                                    sticky='ew', ipady=self.get_cell_ipady(i, title))
                     cell_row.append(weight_cell)
-                    combo_row.append(None)
-                    check_row.append(None)
                     
                 elif interactive and i > 0 and j == 3:  # Checkbox column (back to j == 3)
                     check_var = tk.BooleanVar()
-                    check_frame = tk.Frame(frame, bg=self.COLORS['white'], height=self.scaled_cell_height + 16)
+                    self._check_index[str(check_var)] = len(check_vars)
+                    check_var.trace_add('write', self._on_inapplicability_changed)
+                    check_frame = tk.Frame(frame, bg=palette.white, height=self.scaled_cell_height + 16)
                     check_frame.pack_propagate(False)
                     check_frame.grid(row=i, column=j, padx=3, pady=3, sticky='ew')
                     
-                    checkbox = tk.Checkbutton(check_frame, variable=check_var, bg=self.COLORS['white'],
-                                            activebackground=self.COLORS['white'], selectcolor=self.COLORS['white'],
-                                            fg=self.COLORS['dark'], highlightthickness=0, relief='flat',
-                                            command=lambda idx=i: self.update_weight_value(idx))
+                    checkbox = tk.Checkbutton(check_frame, variable=check_var, bg=palette.white,
+                                            activebackground=palette.white, selectcolor=palette.white,
+                                            fg=palette.dark, highlightthickness=0, relief='flat')
                     checkbox.place(relx=0.5, rely=0.5, anchor='center')
                     cell_row.append(check_frame)
-                    combo_row.append(None)
-                    check_row.append(check_var)
+                    check_vars.append(check_var)
                     
                 else:  # Regular entry cells
-                    cell = self.create_table_cell(frame, i, j, text, color, title)
+                    cell = self.create_table_cell(frame, i, j, text, color, title, measurable)
                     cell.grid(row=i, column=j, padx=3, pady=self.get_cell_pady(i, title), 
                              sticky='ew', ipady=self.get_cell_ipady(i, title))
                     cell_row.append(cell)
-                    combo_row.append(None)
-                    check_row.append(None)
             
             cells.append(cell_row)
-            combo_vars.append(combo_row)
-            check_vars.append(check_row)
-        
-        # Configure grid weights
-        for j in range(len(data[0])):
-            frame.grid_columnconfigure(j, weight=1)
-        for i in range(len(data)):
-            frame.grid_rowconfigure(i, minsize=self.scaled_cell_height)
+        
+        # Configure all rows with a single grid call (column weights are set by auto_resize_table)
+        frame.grid_rowconfigure(tuple(range(len(data))), minsize=self.scaled_cell_height)
             
         # Auto-resize columns
-        self.auto_resize_table(cells, frame, len(data[0]), title == "Risk Assessment")
+        self.auto_resize_table(measurable, frame, col_min_widths)
         
         return container, cells, combo_vars, check_vars
     
-    def create_table_cell(self, parent, i, j, text, color, table_title):
-        """Create individual table cell with appropriate styling"""
+    def create_table_cell(self, parent, i, j, text, color, table_title, measurable):
+        """Create individual table cell with appropriate styling, recording Entry text/font in measurable"""
+        fonts = self._FONTS
+        palette = self.PALETTE
         # Determine cell styling based on position and table type
         is_header = i == 0 or (table_title == "Results" and i == 2)
         is_calculation_row = table_title == "Results" and i == 1
@@ -308,57 +404,52 @@ class BIDOptimized:
         needs_wrapping = (table_title == "Score Matrix" and j in [1, 2, 3, 4] and len(text) > 50)
         
         if needs_wrapping:
-            # Use Text widget for multiline text in Score Matrix description columns
+            # Use a wrapped Label for read-only multiline text in Score Matrix description columns
+            wraplength = int(320 * self.scale_factor)
             if is_header:
-                text_widget = tk.Text(parent, bg=color, fg=self.COLORS['white'],
-                                    font=('Segoe UI', self.scaled_font_size, 'bold'),
-                                    wrap='word', relief='flat', bd=0, padx=5, pady=3,
-                                    height=2, width=30, state='normal',
-                                    highlightthickness=2, highlightcolor=self.COLORS['primary'],
-                                    highlightbackground='#e1e5e9', insertbackground=self.COLORS['white'])
-                text_widget.insert('1.0', text)
-                text_widget.config(state='disabled')
-                text_widget.tag_configure("center", justify='center')
-                text_widget.tag_add("center", "1.0", "end")
+                text_widget = tk.Label(parent, text=text, bg=color, fg=palette.white,
+                                     font=fonts['header'],
+                                     wraplength=wraplength, justify='center', anchor='n',
+                                     relief='flat', bd=0, padx=5, pady=3,
+                                     highlightthickness=2, highlightbackground='#e1e5e9')
             else:
                 bg_color, fg_color = self.get_data_cell_colors(i, j, text, table_title)
-                text_widget = tk.Text(parent, bg=bg_color, fg=fg_color,
-                                    font=('Segoe UI', self.scaled_font_size - 1, 'normal'),
-                                    wrap='word', relief='flat', bd=0, padx=5, pady=3,
-                                    height=2, width=30, state='normal',
-                                    highlightthickness=2, highlightcolor=self.COLORS['primary'],
-                                    highlightbackground='#e1e5e9', insertbackground=fg_color)
-                text_widget.insert('1.0', text)
-                text_widget.config(state='disabled')
-                # Configure left alignment for Score Matrix data cells
-                text_widget.tag_configure("left", justify='left')
-                text_widget.tag_add("left", "1.0", "end")
+                # Left alignment for Score Matrix data cells
+                text_widget = tk.Label(parent, text=text, bg=bg_color, fg=fg_color,
+                                     font=fonts['data'],
+                                     wraplength=wraplength, justify='left', anchor='nw',
+                                     relief='flat', bd=0, padx=5, pady=3,
+                                     highlightthickness=2, highlightbackground='#e1e5e9')
             return text_widget
         
         elif is_header:
             # Headers: All tables use center alignment
             justify = 'center'
+            font_style = fonts['header_mono'] if i == 0 else fonts['header']
             cell = self.create_modern_entry(parent, readonlybackground=color, state='normal',
-                                          font=('Consolas' if i == 0 else 'Segoe UI', self.scaled_font_size, 'bold'),
-                                          justify=justify, fg=self.COLORS['white'], insertbackground=self.COLORS['white'],
+                                          font=font_style,
+                                          justify=justify, fg=palette.white, insertbackground=palette.white,
                                           highlightthickness=0)
             cell.insert(0, text)
+            measurable[j].append((text, font_style))
             cell.configure(state='readonly')
             return cell
         
         elif is_calculation_row:
-            cell = self.create_modern_entry(parent, readonlybackground=self.COLORS['white'], state='normal',
-                                          font=('Segoe UI', self.scaled_font_size, 'bold'), justify='center',
-                                          fg=self.COLORS['dark'], insertbackground=self.COLORS['dark'],
+            font_style = fonts['header']
+            cell = self.create_modern_entry(parent, readonlybackground=palette.white, state='normal',
+                                          font=font_style, justify='center',
+                                          fg=palette.dark, insertbackground=palette.dark,
                                           highlightthickness=2, highlightcolor=color)
             cell.insert(0, text)
+            measurable[j].append((text, font_style))
             cell.configure(state='readonly')
             return cell
         
         else:
             # Data cell styling
             bg_color, fg_color = self.get_data_cell_colors(i, j, text, table_title)
-            font_style = ('Segoe UI', self.scaled_font_size - 1, 'bold' if j == 0 else 'normal')
+            font_style = fonts['data_bold'] if j == 0 else fonts['data']
               # Alignment rules for different tables
             if table_title == "Score Matrix":
                 # Score Matrix: all columns left-aligned
@@ -376,18 +467,20 @@ class BIDOptimized:
             
             # Insert text and make readonly
             cell.insert(0, text)
+            measurable[j].append((text, font_style))
             cell.configure(state='readonly')
             return cell
 
     def get_data_cell_colors(self, i, j, text, table_title):
         """Get appropriate colors for data cells"""
+        palette = self.PALETTE
         if table_title == "Results" and j == 1 and i >= 3:  # Risk level colors
             level = text
-            return self.RISK_COLORS.get(level, (self.COLORS['light'], self.COLORS['dark']))
+            return RISK_COLORS.get(level, (palette.light, palette.dark))
         elif j == 0:  # First column
-            return (self.COLORS['light'] if i % 2 == 0 else self.COLORS['white'], self.COLORS['dark'])
+            return (palette.light if i % 2 == 0 else palette.white, palette.dark)
         else:
-            return (self.COLORS['white'], '#495057')
+            return (palette.white, '#495057')
 
     def get_cell_pady(self, i, table_title):
         """Get appropriate pady for cell"""
@@ -403,9 +496,13 @@ class BIDOptimized:
 
     def create_tables(self):
         """Create all three tables"""
+        # Suspend scroll region updates while the widgets are built
+        self.main_frame.unbind("<Configure>")
+        
         # Table 1 - Score Matrix
         table1_container, self.cells1, _, _ = self.create_table(
-            self.main_frame, "Score Matrix", self.TABLE1_DATA, self.COLORS['dark'])
+            self.main_frame, "Score Matrix", TABLE1_DATA, self.COLORS['dark'],
+            col_min_widths=(200, 350, 350, 350, 350))  # Category, Score columns (1-4)
         table1_container.pack(fill='both', expand=True, padx=20, pady=(20, 15))
         
         # Bottom frame for tables 2 and 3
@@ -417,16 +514,23 @@ class BIDOptimized:
         
         # Table 2 - Risk Assessment (interactive)
         table2_container, self.cells2, self.combo_vars, self.check_vars = self.create_table(
-            bottom_frame, "Risk Assessment", self.TABLE2_DATA, self.COLORS['secondary'], interactive=True)
+            bottom_frame, "Risk Assessment", TABLE2_DATA, self.COLORS['secondary'],
+            col_min_widths=(250, 100, 80, 120), interactive=True)  # Category, Value, Weight, Inapplicability
         table2_container.grid(row=0, column=0, sticky='nsew', padx=(0, 15), pady=15)
+        self._weight_cells = [row[2] for row in self.cells2[1:]]  # Weight Entry of each category
         
         # Table 3 - Results
         table3_container, self.cells3, _, _ = self.create_table(
-            bottom_frame, "Results", self.TABLE3_DATA, self.COLORS['success'])
+            bottom_frame, "Results", TABLE3_DATA, self.COLORS['success'],
+            col_min_widths=(150, 150))
         table3_container.grid(row=0, column=1, sticky='nsew', padx=(10, 0), pady=15)
         
         # Save button
         self.create_save_button()
+        
+        # Restore scroll region tracking and size the canvas once for all tables
+        self.main_frame.bind("<Configure>", self._on_frame_configure)
+        self.root.after_idle(self._on_frame_configure)
 
     def create_save_button(self):
         """Create save button and help button with hover effects"""
@@ -465,174 +569,161 @@ class BIDOptimized:
         self.help_button.bind("<Enter>", lambda e: self.help_button.config(bg='#545b62'))
         self.help_button.bind("<Leave>", lambda e: self.help_button.config(bg=self.COLORS['gray']))
 
-    def auto_resize_table(self, cells, frame, num_cols, is_risk_table=False):
-        """Auto-resize table columns based on content using original copy widths"""
-        import tkinter.font as tkFont
+    def auto_resize_table(self, measurable, frame, col_min_widths):
+        """Auto-resize table columns based on content and the per-column minimum widths"""
         col_widths = []
         
-        for j in range(num_cols):
+        for column_cells, min_width in zip(measurable, col_min_widths):
             max_width = 0
             
-            # Calculate maximum width for this column
-            for i in range(len(cells)):
-                if isinstance(cells[i][j], tk.Entry):
-                    cell = cells[i][j]
-                    text = cell.get() if hasattr(cell, 'get') else ""
-                    font = cell.cget("font") if hasattr(cell, 'cget') else ("Segoe UI", self.scaled_font_size)
-                else:
-                    # Skip non-Entry widgets (ComboBox, Checkboxes, etc.)
-                    continue
-                
+            # Calculate maximum width for this column (only Entry cells are measured)
+            for text, font in column_cells:
                 if text:
                     try:
-                        font_obj = tkFont.Font(font=font)
+                        font_obj = self._font_cache.get(font)
+                        if font_obj is None:
+                            font_obj = self._font_cache[font] = tkFont.Font(font=font)
                         text_width = font_obj.measure(text)
                         max_width = max(max_width, text_width)
                     except:
                         # Fallback for font issues
                         max_width = max(max_width, len(text) * 8)
             
-            # Special handling for different tables and columns
-            if frame.master.master and hasattr(frame.master.master, 'winfo_children'):
-                # Get table title from parent structure
-                table_containers = frame.master.master.winfo_children()
-                table_index = 0
-                for widget in table_containers:
-                    if hasattr(widget, 'winfo_children') and frame.master in widget.winfo_children():
-                        break
-                    table_index += 1
-                
-                # Apply specific width rules based on table and column (original copy widths)
-                if table_index == 0:  # Score Matrix (without Weight column)
-                    if j == 0:  # Category column
-                        min_width = 200
-                    elif j in [1, 2, 3, 4]:  # Score columns (1-4)
-                        min_width = 350  # Same width as original for long descriptions
-                elif is_risk_table:  # Risk Assessment table (with Weight column)
-                    if j == 0:  # Category column
-                        min_width = 250
-                    elif j == 1:  # Value column
-                        min_width = 100
-                    elif j == 2:  # Weight column
-                        min_width = 80
-                    else:  # Inapplicability column
-                        min_width = 120
-                else:  # Results table
-                    min_width = 150
-            else:
-                min_width = 150  # Default minimum width
-            
             # Use the larger of calculated width or minimum width
             final_width = max(max_width + int(30 * self.scale_factor), 
                             int(min_width * self.scale_factor))
             col_widths.append(final_width)
         
-        # Set column configurations
-        for j in range(num_cols):
-            frame.grid_columnconfigure(j, minsize=col_widths[j], weight=1)
-        
-        # Update canvas scroll region to accommodate wider content
-        if hasattr(self, 'canvas'):
-            self.root.after(100, lambda: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+        # Set column configurations with raw grid commands (skips the Python option wrapper)
+        for j, width in enumerate(col_widths):
+            frame.tk.call('grid', 'columnconfigure', frame._w, j, '-minsize', width, '-weight', 1)
+
+    def _on_inapplicability_changed(self, var_name, *args):
+        """Variable trace callback for the Inapplicability checkboxes"""
+        index = self._check_index[var_name]
+        self.update_weight_value(index, bool(self.check_vars[index].get()))
+
+    def update_weight_value(self, index, is_checked):
+        """Update weight values after the inapplicability of one category changed"""
+        if self._checked[index] == is_checked:
+            return
+        
+        # Update the running redistribution totals for this single toggle
+        self._checked[index] = is_checked
+        sign = 1 if is_checked else -1
+        self._checked_weight_sum += sign * REDISTRIBUTION_WEIGHTS[index]
+        self._unchecked_count -= sign
+        redistributed_weight = self._checked_weight_sum / self._unchecked_count if self._unchecked_count > 0 else 0
+
+        # Current weights as shown in the table (rounded to the displayed precision)
+        self.current_weights = [0.0 if checked else round(weight + redistributed_weight, 3)
+                                for weight, checked in zip(REDISTRIBUTION_WEIGHTS, self._checked)]
+
+        # Weight cells are rewritten with the score on the next idle refresh
+        self._weights_dirty = True
+        self.update_total_score()
 
-    def update_weight_value(self, row_index):
-        """Update weight values based on inapplicability checkboxes"""
-        original_weights = [0.15, 0.12, 0.1, 0.08, 0.12, 0.08, 0.07, 0.1, 0.05, 0.06, 0.07]
-        
-        # Calculate redistribution
-        total_checked_weight = sum(original_weights[i-1] for i in range(1, len(self.check_vars)) 
-                                 if self.check_vars[i][3] and self.check_vars[i][3].get())
-        
-        unchecked_count = sum(1 for i in range(1, len(self.check_vars)) 
-                            if not (self.check_vars[i][3] and self.check_vars[i][3].get()))
-        
-        # Update all weights
-        for i in range(1, len(self.check_vars)):
-            weight_cell = self.cells2[i][2]
-            weight_cell.configure(state='normal')
-            
-            if self.check_vars[i][3] and self.check_vars[i][3].get():
-                weight_cell.delete(0, tk.END)
-                weight_cell.insert(0, "0")
-            else:
-                original_weight = original_weights[i-1]
-                redistributed_weight = total_checked_weight / unchecked_count if unchecked_count > 0 else 0
-                new_weight = original_weight + redistributed_weight
-                weight_cell.delete(0, tk.END)
-                weight_cell.insert(0, f"{new_weight:.3f}")
-            
-            weight_cell.configure(state='readonly')
-        
+    def _refresh_weight_cells(self):
+        """Rewrite only the weight cells whose displayed text changes"""
+        self._weights_dirty = False
+        weight_texts = self._weight_texts
+        set_entry = self._set_readonly_entry
+        for i, (new_weight, checked, weight_cell) in enumerate(
+                zip(self.current_weights, self._checked, self._weight_cells)):
+            text = "0" if checked else f"{new_weight:.3f}"
+            if text == weight_texts[i]:
+                continue
+            weight_texts[i] = text
+            set_entry(weight_cell, text)
+
+    @staticmethod
+    def _set_readonly_entry(entry, text):
+        """Replace the text of a readonly Entry; returns False without touching it if unchanged"""
+        if entry.get() == text:
+            return False
+        entry.configure(state='normal')
+        entry.delete(0, tk.END)
+        entry.insert(0, text)
+        entry.configure(state='readonly')
+        return True
+
+    def _on_value_changed(self, var_name, *args):
+        """Variable trace callback for the Value comboboxes: store the new value and rescore"""
+        try:
+            value = float(self.root.getvar(var_name))
+        except (ValueError, tk.TclError):
+            value = 1.0  # Unset value contributes nothing to the score
+        self.current_values[self._value_index[var_name]] = value
         self.update_total_score()
 
     def update_total_score(self, event=None):
-        """Calculate and update total score and risk level"""
-        total_score = 0.0
-        
-        for i in range(1, len(self.combo_vars)):
-            combo_var = self.combo_vars[i][1]
-            if combo_var and combo_var.get():
-                try:
-                    value = float(combo_var.get())
-                    weight_str = self.cells2[i][2].get()
-                    if weight_str:
-                        weight = float(weight_str)
-                        total_score += (value - 1) * weight / 3
-                except ValueError:
-                    continue
-        
-        # Cap total score at 1.0 if it exceeds 0.99
-        if total_score > 0.99:
-            total_score = 1.0
+        """Schedule a table refresh, restarting the debounce timer on every change"""
+        if self._update_after_id is not None:
+            self.root.after_cancel(self._update_after_id)
+        self._update_after_id = self.root.after(UPDATE_DEBOUNCE_MS, self._flush_updates)
+
+    def _flush_updates(self):
+        """Write pending weight cells, then calculate and update total score and risk level"""
+        self._update_after_id = None
+        if self._weights_dirty:
+            self._refresh_weight_cells()
+        
+        # Nothing to recompute or redraw if the scored state is the one last shown
+        state = (tuple(self.current_values), tuple(self.current_weights))
+        if state == self._last_score_state:
+            return
+        self._last_score_state = state
+        
+        # Values and weights are kept in memory, so nothing is read back from Tk
+        total_score = compute_total_score(self.current_values, self.current_weights)
+        
+        # Cap total score at 1.0 if it exceeds 0.99, and find its risk level once
+        total_score = 1.0 if total_score > 0.99 else total_score
+        level_index = bisect_left(RISK_THRESHOLDS, total_score)
         
         # Update total score cell
-        total_cell = self.cells3[1][0]
-        total_cell.configure(state='normal')
-        total_cell.delete(0, tk.END)
-        total_cell.insert(0, f"{total_score:.3f}")
-        total_cell.configure(state='readonly')
+        self._set_readonly_entry(self.cells3[1][0], f"{total_score:.3f}")
         
         # Update risk level
-        self.update_risk_level(total_score)
-
-    def update_risk_level(self, total_score):
-        """Update risk level based on total score"""
-        if total_score <= 0.09:
-            risk_level = "Very Low"
-        elif total_score <= 0.39:
-            risk_level = "Low"
-        elif total_score <= 0.69:
-            risk_level = "Medium"
-        elif total_score <= 0.89:
-            risk_level = "High"
-        else:
-            risk_level = "Very High"
-        
-        # Update risk level cell with colors
-        risk_cell = self.cells3[1][1]        
-        risk_cell.configure(state='normal')
-        risk_cell.delete(0, tk.END)
-        risk_cell.insert(0, risk_level)
-        
-        bg_color, fg_color = self.RISK_COLORS[risk_level]
+        self.update_risk_level(level_index)
+
+    def update_risk_level(self, level_index):
+        """Update risk level cell for the RISK_LEVEL_TABLE index of the total score"""
+        # Update risk level cell with colors, only when the level changes
+        if level_index == self._risk_level_index:
+            return
+        self._risk_level_index = level_index
+        risk_level, bg_color, fg_color = RISK_LEVEL_TABLE[level_index]
+        risk_cell = self.cells3[1][1]
+        self._set_readonly_entry(risk_cell, risk_level)
         risk_cell.configure(readonlybackground=bg_color, fg=fg_color, insertbackground=fg_color)
-        risk_cell.configure(state='readonly')
 
     def save_data(self):
         """Save data with visual feedback"""
+        if self._saving:
+            return  # Ignore repeated clicks while a save is already scheduled
+        
         try:
+            self._saving = True
             original_color = self.save_button.cget("bg")
             self.save_button.config(bg=self.COLORS['success'], text="💾 Saving...")
-            self.root.update()
+            # Only redraw the button; pumping the whole event loop here could dispatch user events
+            self.save_button.update_idletasks()
             
             self.root.after(500, lambda: self._complete_save(original_color))
         except Exception as e:
+            self._saving = False
             messagebox.showerror("Error", f"Error during saving: {str(e)}")
             self.save_button.config(bg=self.COLORS['blue'], text="💾 Save Data")
 
     def _complete_save(self, original_color):
         """Complete save operation"""
         try:
+            # Apply a recalculation still waiting on the debounce timer before exporting
+            if self._update_after_id is not None:
+                self.root.after_cancel(self._update_after_id)
+                self._flush_updates()
+            
             if DOCX_AVAILABLE:
                 self._save_to_word()
             else:
@@ -645,6 +736,16 @@ class BIDOptimized:
         except Exception as e:
             messagebox.showerror("Error", f"Error during saving: {str(e)}")
             self.save_button.config(bg=original_color, text="💾 Save Data")
+        finally:
+            self._saving = False
+
+    def _get_output_dir(self):
+        """Return the Output directory, creating it if it doesn't exist on the first save"""
+        output_dir = os.path.join(get_base_path(), "Output")
+        if not BIDOptimized._output_dir_ready:
+            os.makedirs(output_dir, exist_ok=True)
+            BIDOptimized._output_dir_ready = True
+        return output_dir
 
     def _save_to_word(self):
         """Save to Word with formatting following Risk_Assessment_Optimized style"""
@@ -652,11 +753,8 @@ class BIDOptimized:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"BID_Assessment_{timestamp}.docx"
         
-        # Create Output directory if it doesn't exist
-        output_dir = os.path.join(get_base_path(), "Output")
-        os.makedirs(output_dir, exist_ok=True)
-        
         # Destination folder (Output directory)
+        output_dir = self._get_output_dir()
         filepath = os.path.join(output_dir, filename)
         
         # Create Word document
@@ -684,71 +782,45 @@ class BIDOptimized:
         
         doc.add_paragraph()  # Empty space
 
-    def add_score_matrix_table(self, doc):
-        """Adds the Score Matrix table to the Word document"""
-        doc.add_heading('Score Matrix', level=1)
-        
-        # Create table with headers (5 columns, removed Weight)
-        table = doc.add_table(rows=1, cols=5)
+    def add_word_table(self, doc, rows, bold_rows=(0,), bold_first_column=False):
+        """Adds a 'Table Grid' table created with all its rows at once and fills it from rows"""
+        table = doc.add_table(rows=len(rows), cols=len(rows[0]))
         table.style = 'Table Grid'
         table.alignment = WD_TABLE_ALIGNMENT.CENTER
         
-        # Header
-        header_cells = table.rows[0].cells
-        headers = ["Category", "Score 1 (Low)", "Score 2 (Significative)", "Score 3 (Moderate)", "Score 4 (High)"]
-        
-        for i, header in enumerate(headers):
-            header_cells[i].text = header
-            header_cells[i].paragraphs[0].runs[0].bold = True
-        
-        # Add data rows
-        for i in range(1, len(self.TABLE1_DATA)):
-            row_cells = table.add_row().cells
-            for j, cell_text in enumerate(self.TABLE1_DATA[i]):
+        for i, (row_data, table_row) in enumerate(zip(rows, table.rows)):
+            row_cells = table_row.cells
+            for j, cell_text in enumerate(row_data):
                 row_cells[j].text = cell_text
-                # Bold first column (categories)
-                if j == 0:
+                # Bold header/value rows and, if requested, the first column (categories)
+                if i in bold_rows or (j == 0 and bold_first_column):
                     row_cells[j].paragraphs[0].runs[0].bold = True
         
+        return table
+
+    def add_score_matrix_table(self, doc):
+        """Adds the Score Matrix table to the Word document"""
+        doc.add_heading('Score Matrix', level=1)
+        
+        # Headers and data rows (5 columns, removed Weight)
+        self.add_word_table(doc, TABLE1_DATA, bold_first_column=True)
+        
         doc.add_paragraph()  # Space after table
 
     def add_risk_assessment_table(self, doc):
         """Adds the Risk Assessment table to the Word document"""
         doc.add_heading('Risk Assessment', level=1)
         
-        # Create table with headers (4 columns, including Weight)
-        table = doc.add_table(rows=1, cols=4)
-        table.style = 'Table Grid'
-        table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        
-        # Header
-        header_cells = table.rows[0].cells
-        headers = ["Category", "Value (1-4)", "Weight", "Inapplicability"]
+        # Headers (4 columns, including Weight) followed by one row per category
+        rows = [["Category", "Value (1-4)", "Weight", "Inapplicability"]]
+        rows.extend([category,                            # Category name
+                     combo_var.get(),                     # Value (ComboBox)
+                     self.cells2[i][2].get(),             # Weight
+                     "✓" if checked else ""]              # Inapplicability (Checkbox)
+                    for i, (category, combo_var, checked) in enumerate(
+                        zip(self._category_names, self.combo_vars, self._checked), 1))
         
-        for i, header in enumerate(headers):
-            header_cells[i].text = header
-            header_cells[i].paragraphs[0].runs[0].bold = True
-        
-        # Add data rows
-        for i in range(1, len(self.cells2)):
-            row_cells = table.add_row().cells
-            
-            # Category name
-            row_cells[0].text = self.cells2[i][0].get()
-            row_cells[0].paragraphs[0].runs[0].bold = True
-            
-            # Value (ComboBox)
-            combo_var = self.combo_vars[i][1]
-            if combo_var:
-                row_cells[1].text = combo_var.get()
-            
-            # Weight
-            row_cells[2].text = self.cells2[i][2].get()
-            
-            # Inapplicability (Checkbox)
-            check_var = self.check_vars[i][3]  # Back to index 3
-            if check_var:
-                row_cells[3].text = "✓" if check_var.get() else ""
+        self.add_word_table(doc, rows, bold_first_column=True)
         
         doc.add_paragraph()  # Space after table
 
@@ -756,49 +828,19 @@ class BIDOptimized:
         """Adds the Results table to the Word document"""
         doc.add_heading('Results', level=1)
         
-        # Create table with headers
-        table = doc.add_table(rows=1, cols=2)
-        table.style = 'Table Grid'
-        table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        
-        # Header
-        header_cells = table.rows[0].cells
-        headers = ["Total Score", "Risk Level"]
-        
-        for i, header in enumerate(headers):
-            header_cells[i].text = header
-            header_cells[i].paragraphs[0].runs[0].bold = True
-        
-        # Add calculated values row
-        row_cells = table.add_row().cells
-        row_cells[0].text = self.cells3[1][0].get()
-        row_cells[1].text = self.cells3[1][1].get()
-        
-        # Bold the values
-        for cell in row_cells:
-            cell.paragraphs[0].runs[0].bold = True
+        # Header and calculated values row (both bold)
+        rows = [["Total Score", "Risk Level"],
+                [self.cells3[1][0].get(), self.cells3[1][1].get()]]
+        self.add_word_table(doc, rows, bold_rows=(0, 1))
         
         # Add reference table
         doc.add_paragraph()  # Space
         doc.add_paragraph("Risk Level Reference:")
         
-        ref_table = doc.add_table(rows=1, cols=2)
-        ref_table.style = 'Table Grid'
-        ref_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        
-        # Reference header
-        ref_header_cells = ref_table.rows[0].cells
-        ref_header_cells[0].text = "Score Range"
-        ref_header_cells[1].text = "Level"
-        
-        for cell in ref_header_cells:
-            cell.paragraphs[0].runs[0].bold = True
-        
-        # Add reference data (skip first two rows which are calculated values)
-        for i in range(3, len(self.cells3)):
-            ref_row_cells = ref_table.add_row().cells
-            ref_row_cells[0].text = self.cells3[i][0].get()
-            ref_row_cells[1].text = self.cells3[i][1].get()
+        # Reference header, then reference data (skip first two rows which are calculated values)
+        ref_rows = [["Score Range", "Level"]]
+        ref_rows.extend([self.cells3[i][0].get(), self.cells3[i][1].get()] for i in range(3, len(self.cells3)))
+        self.add_word_table(doc, ref_rows)
         
         doc.add_paragraph()  # Space after table
 
@@ -807,61 +849,47 @@ class BIDOptimized:
         if not DOCX_AVAILABLE:
             messagebox.showerror("Error", "python-docx library not available!\nInstall with: pip install python-docx\n\nFalling back to CSV export.")
         
-        import csv
-        import os
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Save Risk Assessment Data
         risk_filename = f"BID_Risk_Assessment_{timestamp}.csv"
         
-        # Create Output directory if it doesn't exist
-        output_dir = os.path.join(get_base_path(), "Output")
-        os.makedirs(output_dir, exist_ok=True)
-        
+        output_dir = self._get_output_dir()
         risk_filepath = os.path.join(output_dir, risk_filename)
         
-        with open(risk_filepath, 'w', newline='', encoding='utf-8') as csvfile:
+        # Each file is written with a single writerows call fed by a generator over parallel columns
+        with open(risk_filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
             writer = csv.writer(csvfile)
-            
-            # Header (including Weight column)
-            writer.writerow(["Category", "Value (1-4)", "Weight", "Inapplicability"])
-            
-            # Data rows
-            for i in range(1, len(self.cells2)):
-                row_data = []
-                for j in range(4):  # Back to 4 columns
-                    if j == 0:  # Category
-                        cell_value = self.cells2[i][j].get()
-                    elif j == 1:  # ComboBox value
-                        combo_var = self.combo_vars[i][j]
-                        cell_value = combo_var.get() if combo_var else ""
-                    elif j == 2:  # Weight
-                        cell_value = self.cells2[i][j].get()
-                    elif j == 3:  # Checkbox (back to j == 3)
-                        check_var = self.check_vars[i][j]
-                        cell_value = "Yes" if (check_var and check_var.get()) else "No"
-                    
-                    row_data.append(cell_value)
-                writer.writerow(row_data)
+            writer.writerow(["Category", "Value (1-4)", "Weight", "Inapplicability"])  # Header (including Weight column)
+            writer.writerows((category, combo_var.get(), weight_cell.get(), "Yes" if checked else "No")
+                             for category, combo_var, weight_cell, checked in zip(
+                                 self._category_names, self.combo_vars, self._weight_cells, self._checked))
         
         # Save Results
         results_filename = f"BID_Results_{timestamp}.csv"
         results_filepath = os.path.join(output_dir, results_filename)
         
-        with open(results_filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            for i in range(len(self.cells3)):
-                row_data = []
-                for j in range(len(self.cells3[i])):
-                    cell_value = self.cells3[i][j].get()
-                    row_data.append(cell_value)
-                writer.writerow(row_data)
+        with open(results_filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+            csv.writer(csvfile).writerows([cell.get() for cell in row] for row in self.cells3)
         
         print(f"CSV files saved: {risk_filepath}, {results_filepath}")
 
     def show_help(self):
         """Show help window with criteria descriptions"""
+        if self._help_window is not None and self._help_window.winfo_exists():
+            # Reuse the window built on the first open
+            self._help_window.deiconify()
+            self._help_window.lift()
+        else:
+            self._help_window = self._build_help_window()
+        
+        self._help_window.grab_set()
+        
+        # Focus on help window
+        self._help_window.focus_set()
+
+    def _build_help_window(self):
+        """Build the help window; closing it only hides it so it can be shown again"""
         help_window = tk.Toplevel(self.root)
         help_window.title("Criteria Descriptions - Help")
         help_window.geometry("1200x700")  # Increased height to accommodate tool explanation
@@ -870,7 +898,6 @@ class BIDOptimized:
         
         # Center the window
         help_window.transient(self.root)
-        help_window.grab_set()
         
         # Title
         title_label = tk.Label(help_window, text="Cybersecurity Criteria Descriptions", 
@@ -891,52 +918,38 @@ class BIDOptimized:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Create table frame
-        table_frame = tk.Frame(scrollable_frame, bg=self.COLORS['white'])
-        table_frame.pack(fill='both', expand=True, padx=15, pady=10)  # Reduced horizontal padding
-        
-        # Table headers
-        header_frame = tk.Frame(table_frame, bg=self.COLORS['dark'], relief='ridge', bd=1)
-        header_frame.pack(fill='x', pady=(0, 2))
-        
-        # Configure grid for better column control
-        header_frame.grid_columnconfigure(0, weight=0, minsize=350)  # Increased width for criterion
-        header_frame.grid_columnconfigure(1, weight=1)  # Flexible width for description
-        
-        criterion_header = tk.Label(header_frame, text="Criterion", font=('Segoe UI', self.scaled_font_size, 'bold'),
-                                   bg=self.COLORS['dark'], fg=self.COLORS['white'], anchor='w',
-                                   padx=15, pady=10)
-        criterion_header.grid(row=0, column=0, sticky='ew')
-        
-        desc_header = tk.Label(header_frame, text="Description", font=('Segoe UI', self.scaled_font_size, 'bold'),
-                              bg=self.COLORS['dark'], fg=self.COLORS['white'], anchor='w',
-                              padx=15, pady=10)
-        desc_header.grid(row=0, column=1, sticky='ew')
+        # Criteria table: a single Treeview draws every row, no per-row Frame/Label widgets
+        data_font = ('Segoe UI', self.scaled_font_size - 1)
+        font_obj = self._font_cache.get(data_font)
+        if font_obj is None:
+            font_obj = self._font_cache[data_font] = tkFont.Font(font=data_font)
+        
+        # Treeview cells do not wrap, so break each description to the column width up front
+        desc_width = 800
+        descriptions = []
+        for description in self.CRITERIA_DESCRIPTIONS.values():
+            chars = max(20, len(description) * desc_width // max(1, font_obj.measure(description)))
+            descriptions.append(textwrap.fill(description, chars))
+        max_lines = max(d.count('\n') + 1 for d in descriptions)
+        
+        style = ttk.Style(help_window)
+        style.configure('Help.Treeview', font=data_font, background=self.COLORS['white'], foreground='#495057',
+                        rowheight=max_lines * font_obj.metrics('linespace') + 16)
+        style.configure('Help.Treeview.Heading', font=('Segoe UI', self.scaled_font_size, 'bold'))
+        
+        tree = ttk.Treeview(scrollable_frame, columns=('criterion', 'description'), show='headings',
+                            style='Help.Treeview', height=len(descriptions), selectmode='none')
+        tree.heading('criterion', text="Criterion", anchor='w')
+        tree.heading('description', text="Description", anchor='w')
+        tree.column('criterion', width=350, minwidth=350, stretch=False, anchor='w')  # Criterion names
+        tree.column('description', width=desc_width, stretch=True, anchor='w')  # Flexible width for description
+        tree.tag_configure('even', background=self.COLORS['light'])
+        tree.tag_configure('odd', background=self.COLORS['white'])
         
         # Add criteria rows
-        for i, (criterion, description) in enumerate(self.CRITERIA_DESCRIPTIONS.items()):
-            # Row frame
-            row_color = self.COLORS['light'] if i % 2 == 0 else self.COLORS['white']
-            row_frame = tk.Frame(table_frame, bg=row_color, relief='ridge', bd=1)
-            row_frame.pack(fill='x', pady=1)
-            
-            # Configure grid for consistent column widths
-            row_frame.grid_columnconfigure(0, weight=0, minsize=350)  # Increased width for criterion
-            row_frame.grid_columnconfigure(1, weight=1)  # Flexible width for description
-            
-            # Criterion name (left column)
-            criterion_label = tk.Label(row_frame, text=criterion, 
-                                      font=('Segoe UI', self.scaled_font_size - 1, 'bold'),
-                                      bg=row_color, fg=self.COLORS['dark'], anchor='nw',
-                                      padx=15, pady=8, wraplength=320, justify='left')  # Increased wraplength
-            criterion_label.grid(row=0, column=0, sticky='new')
-            
-            # Description (right column)
-            desc_label = tk.Label(row_frame, text=description,
-                                 font=('Segoe UI', self.scaled_font_size - 1),
-                                 bg=row_color, fg='#495057', anchor='nw',
-                                 padx=15, pady=8, wraplength=950, justify='left')  # Much larger wraplength
-            desc_label.grid(row=0, column=1, sticky='new')
+        for i, (criterion, description) in enumerate(zip(self.CRITERIA_DESCRIPTIONS, descriptions)):
+            tree.insert('', 'end', values=(criterion, description), tags=('even' if i % 2 == 0 else 'odd',))
+        tree.pack(fill='both', expand=True, padx=15, pady=10)
         
         # Add separator and tool explanation section
         separator_frame = tk.Frame(scrollable_frame, bg=self.COLORS['gray'], height=2)
@@ -952,50 +965,7 @@ class BIDOptimized:
         explanation_frame = tk.Frame(scrollable_frame, bg=self.COLORS['light'], relief='ridge', bd=1)
         explanation_frame.pack(fill='x', padx=15, pady=(0, 20))
         
-        explanation_text = """The BID (Bid Phase) Risk Assessment Tool helps evaluate cybersecurity risks during the bidding phase of space projects. Here's how to use it:
-
-1. EVALUATION PROCESS:
-   • For each of the 11 cybersecurity criteria, assess the quality of requirements in the ITT (Invitation to Tender)
-   • Rate each criterion from 1 to 4 based on how well it is defined in the tender documents:
-     - Score 1 (Low Risk): Well-defined, detailed requirements with clear specifications
-     - Score 2 (Significative Risk): Partially defined with some details but lacking specificity
-     - Score 3 (Moderate Risk): Vague or unclear requirements with minimal guidance
-     - Score 4 (High Risk): No mention or very poor definition of the requirement
-
-2. WEIGHTING SYSTEM:
-   • Each criterion has a predefined weight based on its importance to overall cybersecurity
-   • Higher weights are assigned to more critical security aspects like:
-     - Cybersecurity Requirements (15%)
-     - Security Architecture Constraints (12%)
-     - Supply Chain Security (12%)
-
-3. INAPPLICABILITY OPTION:
-   • If a criterion is not applicable to the specific project, check the "Inapplicability" box
-   • The tool will automatically redistribute that criterion's weight among the remaining applicable criteria
-   • This ensures the assessment remains accurate for the project's specific context
-
-4. AUTOMATIC CALCULATION:
-   • The tool calculates a total risk score using the formula: Σ((Score-1) × Weight / 3)
-   • This normalizes scores to a 0-1 scale where:
-     - 0.0-0.1: Very Low Risk
-     - 0.1-0.4: Low Risk
-     - 0.4-0.7: Medium Risk
-     - 0.7-0.9: High Risk
-     - 0.9-1.0: Very High Risk
-
-5. RESULTS INTERPRETATION:
-   • Higher scores indicate greater cybersecurity risk due to poorly defined requirements
-   • Use this assessment to:
-     - Identify areas requiring clarification during the bidding process
-     - Estimate additional effort needed for cybersecurity implementation
-     - Make informed go/no-go decisions on tender participation
-     - Plan appropriate cybersecurity measures and resources
-
-6. EXPORT FUNCTIONALITY:
-   • Save your assessment as a Word document for documentation and reporting
-   • The export includes all evaluation details, scores, and risk analysis results"""
-        
-        explanation_label = tk.Label(explanation_frame, text=explanation_text,
+        explanation_label = tk.Label(explanation_frame, text=HELP_EXPLANATION_TEXT,
                                    font=('Segoe UI', self.scaled_font_size - 1),
                                    bg=self.COLORS['light'], fg='#495057', anchor='nw',
                                    padx=20, pady=15, wraplength=1100, justify='left')
@@ -1005,39 +975,27 @@ class BIDOptimized:
         canvas.pack(side="left", fill="both", expand=True, padx=(0, 5))
         scrollbar.pack(side="right", fill="y")
         
-        # Mouse wheel scrolling for help window only
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        # Mouse wheel scrolling for help window only: one class binding on a custom bindtag
+        # placed first on the scrollable widgets, instead of a binding per widget
+        self._help_canvas = canvas
+        self.root.bind_class('HelpScroll', '<MouseWheel>', self._on_help_mousewheel)
+        for widget in (canvas, scrollable_frame, tree, separator_frame,
+                       explanation_title, explanation_frame, explanation_label):
+            widget.bindtags(('HelpScroll',) + widget.bindtags())
         
-        # Keep track of bound widgets for cleanup
-        bound_widgets = []
-        
-        # Bind mouse wheel only to the help window and its children
-        def bind_mousewheel(widget):
-            widget.bind("<MouseWheel>", _on_mousewheel)
-            bound_widgets.append(widget)
-            for child in widget.winfo_children():
-                bind_mousewheel(child)
-        
-        # Only bind to canvas and scrollable_frame to avoid conflicts
-        canvas.bind("<MouseWheel>", _on_mousewheel)
-        scrollable_frame.bind("<MouseWheel>", _on_mousewheel)
-        bound_widgets.extend([canvas, scrollable_frame])
-        
-        # Ensure proper cleanup when window is closed
+        # Hide instead of destroying so the next open reuses the widgets and bindings
         def on_help_window_close():
-            # Remove all mouse wheel bindings
-            for widget in bound_widgets:
-                try:
-                    widget.unbind("<MouseWheel>")
-                except:
-                    pass  # Widget might be already destroyed
-            help_window.destroy()
+            help_window.grab_release()
+            help_window.withdraw()
         
         help_window.protocol("WM_DELETE_WINDOW", on_help_window_close)
         
-        # Focus on help window
-        help_window.focus_set()
+        return help_window
+
+    def _on_help_mousewheel(self, event):
+        """Scroll the help window canvas (class binding of the 'HelpScroll' bindtag)"""
+        self._help_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        return "break"
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -1,10 +1,19 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkFont
 import math
+import re
+import importlib.util
 import os
 import sys
 import csv
+import logging
+from bisect import bisect_left
 from datetime import datetime
+from functools import partial
+from itertools import product
+
+log = logging.getLogger(__name__)
 
 # Configure environment for UTF-8 compatibility
 os.environ['PYTHONIOENCODING'] = 'utf-8'
@@ -18,15 +27,113 @@ def get_base_path():
         # Running as script
         return os.path.dirname(os.path.abspath(__file__))
 
-# Import for Word export/import
-try:
-    from docx import Document
-    from docx.shared import Pt, RGBColor
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.enum.table import WD_TABLE_ALIGNMENT
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+# Import for Word export/import: python-docx (and lxml behind it) is only loaded when first needed, see load_docx()
+DOCX_AVAILABLE = importlib.util.find_spec('docx') is not None
+Document = Pt = RGBColor = WD_ALIGN_PARAGRAPH = WD_TABLE_ALIGNMENT = None
+
+# Qualified tags of the Word body children read on import (paragraphs and tables)
+WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+WORD_P_TAG = WORD_NS + 'p'
+WORD_TBL_TAG = WORD_NS + 'tbl'
+WORD_TR_TAG = WORD_NS + 'tr'
+WORD_TC_TAG = WORD_NS + 'tc'
+WORD_R_TAG = WORD_NS + 'r'
+# Run content -> its text (w:t is read from the element itself)
+WORD_RUN_TEXT = {WORD_NS + 'tab': '\t', WORD_NS + 'br': '\n', WORD_NS + 'cr': '\n'}
+WORD_T_TAG = WORD_NS + 't'
+
+def word_paragraph_text(p):
+    """Text of a w:p element, as Paragraph.text"""
+    parts = []
+    for run in p.iter(WORD_R_TAG):
+        for child in run:
+            if child.tag == WORD_T_TAG:
+                parts.append(child.text or '')
+            else:
+                parts.append(WORD_RUN_TEXT.get(child.tag, ''))
+    return ''.join(parts)
+
+def word_table_texts(table):
+    """Stripped text of every cell of a python-docx table, row by row, read straight from its XML
+    (as Cell.text, without building Row/Cell objects)"""
+    return [['\n'.join(word_paragraph_text(p) for p in tc.iterchildren(WORD_P_TAG)).strip()
+             for tc in tr.iterchildren(WORD_TC_TAG)]
+            for tr in table._tbl.iterchildren(WORD_TR_TAG)]
+
+def load_docx():
+    """Import python-docx on first use into the module globals; returns whether it is available"""
+    global DOCX_AVAILABLE, Document, Pt, RGBColor, WD_ALIGN_PARAGRAPH, WD_TABLE_ALIGNMENT
+    if DOCX_AVAILABLE and Document is None:
+        try:
+            from docx import Document
+            from docx.shared import Pt, RGBColor
+            from docx.enum.text import WD_ALIGN_PARAGRAPH
+            from docx.enum.table import WD_TABLE_ALIGNMENT
+        except ImportError:
+            DOCX_AVAILABLE = False
+    return DOCX_AVAILABLE
+
+def normalized_quadratic_mean(values):
+    """Quadratic mean of 1-5 scores, normalized [1,5] -> [0,1] and clamped"""
+    quadratic_mean = math.sqrt(sum(x * x for x in values) / len(values))
+    return max(0.0, min(1.0, (quadratic_mean - 1) / 4))
+
+# Risk levels in increasing order; their position is the level index used by the lookup tables
+RISK_LEVELS = ("Very Low", "Low", "Medium", "High", "Very High")
+RISK_LEVEL_INDEX = {level: i for i, level in enumerate(RISK_LEVELS)}
+# Legacy text reports: the short probability names they may use
+LEGACY_PROBABILITY_ALIASES = {'VL': 'Very Low', 'L': 'Low', 'M': 'Medium', 'H': 'High', 'VH': 'Very High'}
+# Word import: lower-cased headers expected in an exported asset table (see add_threat_asset_table)
+ASSET_TABLE_HEADERS_LOWER = ('asset', 'vulnerability', 'detection probability', 'defense capability',
+                             'operational impact', 'recovery time', 'likelihood', 'impact', 'risk level')
+# Word import: a whole cell holding a 1-5 score (optionally "Score N"), a 1-5 score inside a cell text,
+# and the texts meaning "no score"
+SCORE_CELL_RE = re.compile(r'(?:score\s*)?([1-5])$', re.IGNORECASE | re.ASCII)
+SCORE_RE = re.compile(r'\b([1-5])\b')
+NO_SCORE_TEXTS = frozenset(('n/a', 'na', '-', ''))
+# Representative normalized (0-1) value of each level, used when importing legacy reports
+CATEGORY_VALUES = {'Very Low': 0.05, 'Low': 0.1, 'Medium': 0.4, 'High': 0.7, 'Very High': 0.9}
+
+# Risk matrix
+RISK_MATRIX = {
+    ("Very High", "Very High"): "Very High", ("Very High", "High"): "Very High",
+    ("Very High", "Medium"): "High", ("Very High", "Low"): "High",
+    ("Very High", "Very Low"): "Medium", ("High", "Very High"): "Very High",
+    ("High", "High"): "High", ("High", "Medium"): "High",
+    ("High", "Low"): "Medium", ("High", "Very Low"): "Low",
+    ("Medium", "Very High"): "High", ("Medium", "High"): "High",
+    ("Medium", "Medium"): "Medium", ("Medium", "Low"): "Low",
+    ("Medium", "Very Low"): "Low", ("Low", "Very High"): "Medium",
+    ("Low", "High"): "Medium", ("Low", "Medium"): "Low",
+    ("Low", "Low"): "Low", ("Low", "Very Low"): "Very Low",
+    ("Very Low", "Very High"): "Low", ("Very Low", "High"): "Low",
+    ("Very Low", "Medium"): "Low", ("Very Low", "Low"): "Very Low",
+    ("Very Low", "Very Low"): "Very Low"
+}
+
+# Upper bounds (inclusive) of Very Low, Low, Medium and High for a normalized [0,1] value
+LEVEL_THRESHOLDS = (0.1, 0.4, 0.7, 0.9)
+
+def score_level(value):
+    """Converts a normalized [0,1] value to its RISK_LEVELS index"""
+    return bisect_left(LEVEL_THRESHOLDS, value)
+
+# Level index for every tuple of one to three "1"-"5" score strings, as read from the asset table
+QUADRATIC_MEAN_LEVELS = {scores: score_level(normalized_quadratic_mean([int(s) for s in scores]))
+                         for n in (1, 2, 3) for scores in product("12345", repeat=n)}
+
+# Word risk matrix font color (RGB) of each level
+RISK_FONT_RGB = {
+    "Very High": (139, 0, 0),  # Dark Red
+    "High": (220, 20, 60),  # Red
+    "Medium": (255, 140, 0),  # Orange
+    "Low": (184, 134, 11),  # Dark Yellow
+    "Very Low": (34, 139, 34)  # Green
+}
+
+# RISK_MATRIX as level indexes: RISK_INDEX_MATRIX[likelihood_index][impact_index] -> risk level index
+RISK_INDEX_MATRIX = tuple(tuple(RISK_LEVEL_INDEX[RISK_MATRIX[(likelihood, impact)]] for impact in RISK_LEVELS)
+                          for likelihood in RISK_LEVELS)
 
 class RiskAssessmentTool:
     """Optimized Risk Assessment Tool for space missions"""
@@ -38,24 +145,52 @@ class RiskAssessmentTool:
         'asset_header': '#38b2ac', 'asset_bg': '#f0fff4'
     }    
     # Main table data
-    THREATS = [
+    THREATS = (
         "Data Corruption", "Physical/Logical Attack", "Interception/Eavesdropping",
         "Jamming", "Denial-of-Service", "Masquerade/Spoofing", "Replay",
         "Software Threats", "Unauthorized Access/Hijacking", 
-        "Tainted hardware components", "Supply Chain"    ]
+        "Tainted hardware components", "Supply Chain"    )
+    # Threat name -> row in THREATS, for constant-time validation of names read from reports
+    THREAT_INDEX = {threat: i for i, threat in enumerate(THREATS)}
+    
+    # Fallback asset categories when Asset.csv cannot be read
+    DEFAULT_ASSET_CATEGORIES = (
+        ("Ground", "Ground Stations"), ("Ground", "Mission Control"),
+        ("Ground", "Data Processing Centers"), ("Ground", "Remote Terminals"),
+        ("Ground", "User Ground Segment"), ("Space", "Platform"),
+        ("Space", "Payload"), ("Link", "Link"), ("User", "User")
+    )
+    
+    # Last Asset.csv parse, shared by every instance: (path, modification time) and its categories
+    _ASSET_CATEGORIES_CACHE_KEY = None
+    _ASSET_CATEGORIES_CACHE = None
     
-    def load_asset_categories_from_csv(self):
+    @classmethod
+    def load_asset_categories_from_csv(cls):
         """Load asset categories from Asset.csv (only categories and subcategories, no duplicates)"""
         assets_file = os.path.join(get_base_path(), "Asset.csv")
         asset_categories = []
         seen_combinations = set()
         
         try:
+            # Reuse the previous parse while the file is unchanged
+            cache_key = (assets_file, os.path.getmtime(assets_file))
+            if cls._ASSET_CATEGORIES_CACHE_KEY == cache_key:
+                return cls._ASSET_CATEGORIES_CACHE
+            
             with open(assets_file, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile, delimiter=';')
+                reader = csv.reader(csvfile, delimiter=';')
+                # Column positions, resolved once from the header row
+                header = next(reader)
+                category_idx = header.index('categories')
+                subcategory_idx = header.index('subCategories')
+                min_len = max(category_idx, subcategory_idx) + 1
                 for row in reader:
-                    category = row.get('categories', '').strip()
-                    subcategory = row.get('subCategories', '').strip()
+                    # Skip blank and short lines (as DictReader did)
+                    if len(row) < min_len:
+                        continue
+                    category = row[category_idx].strip()
+                    subcategory = row[subcategory_idx].strip()
                     
                     # Create tuple for category-subcategory combination
                     combination = (category, subcategory)
@@ -66,113 +201,99 @@ class RiskAssessmentTool:
                         asset_categories.append(combination)
             
             #print(f"[OK] Loaded {len(asset_categories)} unique asset categories from {assets_file}")
-            return asset_categories
+            cls._ASSET_CATEGORIES_CACHE_KEY = cache_key
+            cls._ASSET_CATEGORIES_CACHE = tuple(asset_categories)
+            return cls._ASSET_CATEGORIES_CACHE
             
         except FileNotFoundError:
             #print(f"[NO] File not found: {assets_file}")
             # Fallback asset categories
-            return [
-                ("Ground", "Ground Stations"), ("Ground", "Mission Control"),
-                ("Ground", "Data Processing Centers"), ("Ground", "Remote Terminals"),
-                ("Ground", "User Ground Segment"), ("Space", "Platform"),
-                ("Space", "Payload"), ("Link", "Link"), ("User", "User")
-            ]
+            return cls.DEFAULT_ASSET_CATEGORIES
         except Exception as e:
             #print(f"[NO] Error loading asset categories: {e}")
-            return [
-                ("Ground", "Ground Stations"), ("Ground", "Mission Control"),
-                ("Ground", "Data Processing Centers"), ("Ground", "Remote Terminals"),
-                ("Ground", "User Ground Segment"), ("Space", "Platform"),
-                ("Space", "Payload"), ("Link", "Link"), ("User", "User")
-            ]
+            return cls.DEFAULT_ASSET_CATEGORIES
     
     # Criteria table data (5x6 + header) - Transposed format
-    CRITERIA_DATA = [
-        ["Score", "Vulnerability Level", "Detection Probability", "Defense Capability", "Operational Impact", "Recovery Time"],
-        ["Score 1 (Very Low)", "No know or already resolved vulnerabilities", "Continuous real-time monitoring with automated threat detection and immediate alerts", "Comprehensive defense: effective mitigations, restricted access controls, and administrative privilege requirements", "No impact thanks to redundancy with predefined automated response", "Immediate restoration with automated procedures"],
-        ["Score 2 (Low)", "Know vulnerability, mitigate throught hardening and patches", "Robust monitoring systems with automated detection and rapid response capabilities", "Strong defense: robust mitigations, controlled access pathways, and elevated privilege requirements", "Negligible impact, quick response and system easily restored", "Quick recovery within hours to days using standard procedures"],
-        ["Score 3 (Moderate)", "Know vulnerability, but only partially mitigated", "Standard monitoring with periodic scans and manual analysis required", "Moderate defense: limited mitigations, accessible entry points, and standard privilege requirements", "Medium impact with manual response, but mission continues", "Manual recovery requiring weeks of coordinated effort"],
-        ["Score 4 (High)", "Known vulnerability, with no effective mitigation", "Limited monitoring capabilities with infrequent checks and slow detection", "Weak defense: insufficient mitigations, easily accessible systems, and moderate privilege requirements", "Serious impact with slow response, mission temporarily interrupted", "Complex recovery requiring months of specialized intervention"],
-        ["Score 5 (Very High)", "Actively exploitable vulnerability, with no defense", "No monitoring systems or detection capabilities in place", "No defense: absent mitigations, unrestricted access, and no privilege requirements", "Permanent loss of assets or mission with no response capability", "Impossible recovery or permanent system loss"]    ]
+    CRITERIA_DATA = (
+        ("Score", "Vulnerability Level", "Detection Probability", "Defense Capability", "Operational Impact", "Recovery Time"),
+        ("Score 1 (Very Low)", "No know or already resolved vulnerabilities", "Continuous real-time monitoring with automated threat detection and immediate alerts", "Comprehensive defense: effective mitigations, restricted access controls, and administrative privilege requirements", "No impact thanks to redundancy with predefined automated response", "Immediate restoration with automated procedures"),
+        ("Score 2 (Low)", "Know vulnerability, mitigate throught hardening and patches", "Robust monitoring systems with automated detection and rapid response capabilities", "Strong defense: robust mitigations, controlled access pathways, and elevated privilege requirements", "Negligible impact, quick response and system easily restored", "Quick recovery within hours to days using standard procedures"),
+        ("Score 3 (Moderate)", "Know vulnerability, but only partially mitigated", "Standard monitoring with periodic scans and manual analysis required", "Moderate defense: limited mitigations, accessible entry points, and standard privilege requirements", "Medium impact with manual response, but mission continues", "Manual recovery requiring weeks of coordinated effort"),
+        ("Score 4 (High)", "Known vulnerability, with no effective mitigation", "Limited monitoring capabilities with infrequent checks and slow detection", "Weak defense: insufficient mitigations, easily accessible systems, and moderate privilege requirements", "Serious impact with slow response, mission temporarily interrupted", "Complex recovery requiring months of specialized intervention"),
+        ("Score 5 (Very High)", "Actively exploitable vulnerability, with no defense", "No monitoring systems or detection capabilities in place", "No defense: absent mitigations, unrestricted access, and no privilege requirements", "Permanent loss of assets or mission with no response capability", "Impossible recovery or permanent system loss")    )
+    
+    # Criteria descriptions shown in the help window
+    CRITERIA_HELP = {
+        "Vulnerability Level": "Measures the presence and severity of known security vulnerabilities in the system. Lower scores indicate well-patched systems with no known vulnerabilities, while higher scores indicate systems with actively exploitable vulnerabilities.",
+        "Detection Probability": "Evaluates the likelihood that malicious activities will be detected by monitoring and security systems. Higher scores indicate comprehensive real-time monitoring with automated threat detection, while lower scores indicate limited or no detection capabilities.",
+        "Defense Capability": "Assesses comprehensive defense including effective mitigations, restricted access controls, and administrative privilege requirements. This encompasses countermeasures, access protection measures, and privilege management systems working together as a unified defense strategy.",
+        "Operational Impact": "Measures the potential impact on mission operations if the threat materializes. This considers service disruption, data loss, and effects on critical mission functions.",
+        "Recovery Time": "Evaluates the time and resources required to restore normal operations after a security incident. This includes backup systems, recovery procedures, and business continuity planning."
+    }
     
-    # Risk matrix
-    RISK_MATRIX = {
-        ("Very High", "Very High"): "Very High", ("Very High", "High"): "Very High",
-        ("Very High", "Medium"): "High", ("Very High", "Low"): "High",
-        ("Very High", "Very Low"): "Medium", ("High", "Very High"): "Very High",
-        ("High", "High"): "High", ("High", "Medium"): "High",
-        ("High", "Low"): "Medium", ("High", "Very Low"): "Low",
-        ("Medium", "Very High"): "High", ("Medium", "High"): "High",
-        ("Medium", "Medium"): "Medium", ("Medium", "Low"): "Low",
-        ("Medium", "Very Low"): "Low", ("Low", "Very High"): "Medium",
-        ("Low", "High"): "Medium", ("Low", "Medium"): "Low",
-        ("Low", "Low"): "Low", ("Low", "Very Low"): "Very Low",
-        ("Very Low", "Very High"): "Low", ("Very Low", "High"): "Low",
-        ("Very Low", "Medium"): "Low", ("Very Low", "Low"): "Very Low",
-        ("Very Low", "Very Low"): "Very Low"    }
     # Security controls for each threat
     THREAT_COUNTERMEASURES = {
-        "Data Corruption": [
+        "Data Corruption": (
             "Configuration Management", "Tamper resistant body", "Tamper Protection", 
             "Disable Physical Ports", "Anti-counterfeit Hardware", "Secure disposal or reuse of equipment",
             "Access-based network segmentation", "Vulnerability Management", "Malware Protection",
             "ASIC/FPGA Manufacturing"
-        ],
-        "Physical/Logical Attack": [
+        ),
+        "Physical/Logical Attack": (
             "A tamper resistant body", "Satellite Unit RF Encryption", "Traffic Flow Security",
             "Power Masking", "Secure disposal or reuse of equipment", "Access-based network segmentation",
             "Information classification and labelling", "Vulnerability Management", "Malware Protection"
-        ],
-        "Interception/Eavesdropping": [
+        ),
+        "Interception/Eavesdropping": (
             "Communications Security", "Satellite Unit RF Encryption", "Traffic Flow Security",
             "Power Masking", "Access-based network segmentation", "Information classification and labelling"
-        ],
-        "Jamming": [
+        ),
+        "Jamming": (
             "Resilient Position Navigation and Timing", "Communication Physical Medium Space-Based",
             "Radio Frequency Mapping", "Antenna Nulling and Adaptive Filtering",
             "Defensive Jamming and Spoofing", "Emergency power sources",
             "Real-time physics model-based system verification"
-        ],
-        "Denial-of-Service": [
+        ),
+        "Denial-of-Service": (
             "Security of Power Systems", "System redundancy", "Incident Recovery Plan",
             "Emergency power sources", "Traffic Flow Security",
             "Critical Services Delivery Requirements"
-        ],
-        "Masquerade/Spoofing": [
+        ),
+        "Masquerade/Spoofing": (
             "OSAM Dual Authorization", "Multi factor authentication", "Relay Protection",
             "Smart Contracts", "Resilient Position Navigation and Timing"
-        ],
-        "Replay": [
+        ),
+        "Replay": (
             "Relay Protection", "Satellite Unit RF Encryption", "On-board Message Encryption",
             "Session Termination", "Real-time physics model-based system verification"
-        ],
-        "Software Threats": [
+        ),
+        "Software Threats": (
             "Coding Standard", "Malware Protection", "Vulnerability scanning", "Vulnerability Management",
             "Software Updates", "Dynamic Code Analysis", "Static Code Analysis", "Process ID whitelisting",
             "Software Bill of Materials"
-        ],
-        "Unauthorized Access/Hijacking": [
+        ),
+        "Unauthorized Access/Hijacking": (
             "Access rights", "Identity management", "Remote access management", "Multi factor authentication",
             "Access-based network segmentation", "Backdoor Commands"
-        ],
-        "Tainted hardware components": [
+        ),
+        "Tainted hardware components": (
             "Anti-counterfeit Hardware", "ASIC/FPGA Manufacturing", "Tamper Protection",
             "Supplier Security Management"
-        ],
-        "Supply Chain": [
+        ),
+        "Supply Chain": (
             "Supplier Security Management", "Software Bill of Materials", "Software Supply Chain Integrity",
             "Outsourced development", "Cloud Cybersecurity Measures"
-        ]    }
+        )    }
     
     # Available mission types
-    MISSION_TYPES = [
+    MISSION_TYPES = (
         "Insert type of mission",
         "Earth Observation Mission",
         "Communication Satellite", 
         "Scientific Mission",
         "Navigation Satellite",
         "On-Orbit Service"
-    ]
+    )
     def __init__(self, root):
         self.root = root
         self.root.title("Risk Assessment Tool - Phase 0-A")
@@ -181,20 +302,54 @@ class RiskAssessmentTool:
         
         # Load asset categories from CSV
         self.ASSET_CATEGORIES = self.load_asset_categories_from_csv()
+        # (row index, sub-category, lower-cased sub-category), and lower-cased sub-category -> first row index,
+        # for the asset name matches on import
+        self._asset_names_lower = tuple((i, name, name.lower()) for i, (_, name) in enumerate(self.ASSET_CATEGORIES))
+        self._asset_index_by_name = {}
+        for i, _, name_lower in self._asset_names_lower:
+            self._asset_index_by_name.setdefault(name_lower, i)
+        self._legacy_asset_matches = {}  # Legacy report asset name -> matching row indexes, see legacy_asset_indices()
+        # (category, sub-category, lower-cased category, lower-cased sub-category), for legacy report text scans
+        self._asset_categories_lower = tuple((main_cat, sub_cat, main_cat.lower(), sub_cat.lower())
+                                             for main_cat, sub_cat in self.ASSET_CATEGORIES)
         
         # Data for threats and calculations
         self.threat_data = {}  # Saved data for threat
         self.combo_vars = {}   # ComboBox variables
         self.impact_entries = {}  # Table widgets
+        self._calc_vars = {}  # Computed-cell variables
+        self._calc_levels = {}  # Computed-cell level indexes
+        self._threat_risk_cache = {}  # Threat -> maximum risk of its saved data
+        self._threat_window = None  # Threat Analysis window, built on first open
+        self._threat_canvas = None  # Its scrollable canvas
+        self._help_window = None  # Help window, built on first open
+        self._font_cache = {}  # Shared font objects, see get_font()
+        
+        # Assets whose likelihood / impact must be recalculated on the next idle pass
+        self._pending_likelihood = set()
+        self._pending_impact = set()
+        self._recalc_pending = False
+        self._loading_threat = False  # True while load_threat_data fills the comboboxes
         
         # Variable for mission type
         self.mission_type_var = tk.StringVar(value=self.MISSION_TYPES[0])
         
         self.create_interface()
         
+        # One application-wide wheel handler, it scrolls the canvas under the pointer (see _on_mousewheel)
+        self.root.bind_all("<MouseWheel>", self._on_mousewheel)
+        
         # Set up close confirmation
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+    def get_font(self, size, weight='normal'):
+        """Return the shared Segoe UI font object for a size/weight, created on first use"""
+        font = self._font_cache.get((size, weight))
+        if font is None:
+            font = self._font_cache[(size, weight)] = tkFont.Font(root=self.root, family='Segoe UI',
+                                                                   size=size, weight=weight)
+        return font
+
     def on_closing(self):
         """Handle window closing with confirmation dialog"""
         result = messagebox.askyesno(
@@ -207,103 +362,64 @@ class RiskAssessmentTool:
     
     def disable_mousewheel_on_combobox(self, combo):
         """Intelligently handle mouse wheel on combobox to prevent accidental value changes while allowing scroll"""
-        def on_mousewheel(event):
-            # Check if the combobox dropdown is open
-            try:
-                if combo.tk.call('ttk::combobox::PopdownIsVisible', combo):
-                    # If dropdown is open, allow normal combobox behavior
-                    return
-                else:
-                    # If dropdown is closed, prevent value changes but allow window scrolling
-                    # Find the parent canvas to continue scrolling
-                    widget = event.widget
-                    # Walk up the widget hierarchy to find a canvas
-                    while widget:
-                        if isinstance(widget, tk.Canvas):
-                            widget.yview_scroll(int(-1*(event.delta/120)), "units")
-                            break
-                        widget = widget.master
-                    return "break"  # Prevent combobox value change
-            except:
-                # Fallback: prevent value changes but allow window scrolling
-                widget = event.widget
-                while widget:
-                    if isinstance(widget, tk.Canvas):
-                        widget.yview_scroll(int(-1*(event.delta/120)), "units")
-                        break
-                    widget = widget.master
-                return "break"  # Prevent combobox value change
-        
-        combo.bind("<MouseWheel>", on_mousewheel)
-
-    def setup_global_mousewheel(self, widget, canvas):
-        """Setup global mouse wheel scrolling for any widget relative to a canvas"""
-        def on_global_mousewheel(event):
-            # Scroll the canvas when mouse wheel is used anywhere in the widget
-            try:
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            except:
-                pass  # Ignore errors if canvas is not scrollable
-        
-        # Bind to the widget and all its children recursively
-        def bind_mousewheel_recursive(w):
-            # Always bind to non-combobox widgets
-            if not isinstance(w, ttk.Combobox):
-                w.bind("<MouseWheel>", on_global_mousewheel)
-            
-            # Recursively bind to all children
-            for child in w.winfo_children():
-                bind_mousewheel_recursive(child)
-        
-        # Start recursive binding
-        bind_mousewheel_recursive(widget)
-        
-        # Also bind directly to the main widget and canvas for safety
-        widget.bind("<MouseWheel>", on_global_mousewheel)
-        canvas.bind("<MouseWheel>", on_global_mousewheel)
-
-    def ensure_mousewheel_on_table_cells(self):
-        """Ensure all threat table cells have mouse wheel scrolling - for non-scrollable tables"""
-        def on_cell_mousewheel(event):
-            # For non-scrollable main tables, we can add a gentle visual feedback
-            # or just ignore since there's no scroll needed
-            pass
-        
-        # Apply to all threat cells in main table
-        for threat, cell in self.threat_cells.items():
-            # For main table without scroll, we don't need special handling
-            # but we can still bind for consistency
+        combo.bind("<MouseWheel>", self._on_combobox_mousewheel)
+
+    def _on_combobox_mousewheel(self, event):
+        """Let an open combobox dropdown scroll, otherwise scroll the window instead of changing the value"""
+        try:
+            if event.widget.tk.call('ttk::combobox::PopdownIsVisible', event.widget):
+                # If dropdown is open, allow normal combobox behavior
+                return
+        except tk.TclError:
             pass
+        self.scroll_canvas_under(event.widget.master, event.delta)
+        return "break"  # Prevent combobox value change
+
+    def _on_mousewheel(self, event):
+        """Application-wide wheel handler: scroll the nearest scrollable canvas containing the widget"""
+        widget = event.widget
+        # Comboboxes handle the wheel themselves; popdown listboxes arrive as plain path strings
+        if isinstance(widget, tk.Misc) and not isinstance(widget, ttk.Combobox):
+            self.scroll_canvas_under(widget, event.delta)
+
+    def scroll_canvas_under(self, widget, delta):
+        """Scroll the first canvas with a scrollbar found walking up from widget"""
+        while widget is not None:
+            if isinstance(widget, tk.Canvas) and widget.cget('yscrollcommand'):
+                widget.yview_scroll(int(-1*(delta/120)), "units")
+                return
+            widget = widget.master
+
+    def setup_label_styles(self):
+        """Configure the ttk styles shared by the table cells (colors, fonts and borders are set once here)"""
+        style = ttk.Style(self.root)
+        cell = {'relief': 'ridge', 'borderwidth': 1, 'anchor': 'center'}
+        
+        # Main threat table (a Treeview)
+        style.configure('Threats.Treeview', background=self.COLORS['white'], foreground=self.COLORS['dark'],
+                        fieldbackground=self.COLORS['white'], font=self.get_font(10), rowheight=30)
+        style.configure('Threats.Treeview.Heading', background=self.COLORS['primary'],
+                        foreground=self.COLORS['white'], font=self.get_font(11, 'bold'), relief='ridge', padding=8)
+        
+        # Asset assessment table
+        style.configure('AssetHeader.TLabel', background=self.COLORS['primary'], foreground=self.COLORS['white'],
+                        font=self.get_font(10, 'bold'), **cell)
+        style.configure('AssetCategory.TLabel', background=self.COLORS['light'], foreground=self.COLORS['dark'],
+                        font=self.get_font(9, 'bold'), **cell)
+        style.configure('AssetCell.TLabel', background=self.COLORS['light'], foreground=self.COLORS['dark'],
+                        font=self.get_font(9), **cell)
 
-    def setup_asset_table_mousewheel(self, canvas):
-        """Setup mouse wheel scrolling for asset table in threat analysis window"""
-        def on_asset_table_mousewheel(event):
-            try:
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            except:
-                pass
-        
-        # Apply to all combo boxes and cells in asset assessment table
-        for asset_key in self.combo_vars:
-            for combo_idx, combo_var in self.combo_vars[asset_key].items():
-                # We don't bind directly to comboboxes since they have their own handler
-                pass
-        
-        # Apply to calculated cells
-        for asset_key in self.impact_entries:
-            for col_idx, widget in self.impact_entries[asset_key].items():
-                if hasattr(widget, 'bind') and not isinstance(widget, ttk.Combobox):
-                    widget.bind("<MouseWheel>", on_asset_table_mousewheel)
-    
     def create_interface(self):
         """Creates the main interface"""
+        self.setup_label_styles()
+        
         # Header
         header = tk.Frame(self.root, bg=self.COLORS['light'], height=60)
         header.pack(fill='x')
         header.pack_propagate(False)
         
         tk.Label(header, text="Risk Assessment Tool - Phase 0-A", 
-                font=('Segoe UI', 16, 'bold'),
+                font=self.get_font(16, 'bold'),
                 bg=self.COLORS['light'], fg=self.COLORS['dark']).pack(pady=15)
         
         # Container principale
@@ -323,19 +439,19 @@ class RiskAssessmentTool:
 
         # Mission type selector (separate from the table)
         mission_frame = tk.LabelFrame(main_container, text="Mission Configuration",
-                                     font=('Segoe UI', 11, 'bold'),
+                                     font=self.get_font(11, 'bold'),
                                      bg=self.COLORS['white'], fg=self.COLORS['primary'],
                                      padx=15, pady=10)
         mission_frame.pack(fill='x', pady=(0, 10))
         
         tk.Label(mission_frame, text="Mission Type:",
-                font=('Segoe UI', 10, 'bold'),
+                font=self.get_font(10, 'bold'),
                 bg=self.COLORS['white'], fg=self.COLORS['dark']).pack(anchor='w')
         
         mission_combo = ttk.Combobox(mission_frame,
                                    textvariable=self.mission_type_var,
                                    values=self.MISSION_TYPES,
-                                   font=('Segoe UI', 10),
+                                   font=self.get_font(10),
                                    state='readonly')
         mission_combo.pack(fill='x', pady=(5, 0))
         
@@ -344,42 +460,23 @@ class RiskAssessmentTool:
 
         # Threat table (separate from the mission selector)
         table_frame = tk.LabelFrame(main_container, text="Threat Risk Levels",
-                                   font=('Segoe UI', 12, 'bold'),
+                                   font=self.get_font(12, 'bold'),
                                    bg=self.COLORS['white'], fg=self.COLORS['primary'],
                                    padx=20, pady=15)
         table_frame.pack(fill='both', expand=True)
         
-        # Header
-        headers = ["Threat", "Risk Level"]
-        for j, header in enumerate(headers):
-            cell = tk.Label(table_frame, text=header,
-                           font=('Segoe UI', 11, 'bold'),
-                           bg=self.COLORS['primary'], fg=self.COLORS['white'],
-                           relief='ridge', bd=1)
-            cell.grid(row=0, column=j, sticky='ew', padx=1, pady=1, ipady=8)
-        
-        # Data Rows
-        self.threat_cells = {}
-        for i, threat in enumerate(self.THREATS, 1):
-            # Threat name
-            name_cell = tk.Label(table_frame, text=threat,
-                               font=('Segoe UI', 10),
-                               bg=self.COLORS['white'], fg=self.COLORS['dark'],
-                               relief='ridge', bd=1, anchor='w')
-            name_cell.grid(row=i, column=0, sticky='ew', padx=1, pady=1, ipady=5)
-            
-            # Risk level
-            risk_cell = tk.Label(table_frame, text="",
-                               font=('Segoe UI', 10),
-                               bg=self.COLORS['white'], fg=self.COLORS['dark'],
-                               relief='ridge', bd=1)
-            risk_cell.grid(row=i, column=1, sticky='ew', padx=1, pady=1, ipady=5)
-            
-            self.threat_cells[threat] = risk_cell
-
-        # Grid configuration
-        for j in range(2):
-            table_frame.grid_columnconfigure(j, weight=1)
+        # One Treeview row per threat; the risk column is updated with set()
+        tree = self._threat_tree = ttk.Treeview(table_frame, columns=('threat', 'risk'), show='headings',
+                                                height=len(self.THREATS), selectmode='none',
+                                                style='Threats.Treeview')
+        tree.heading('threat', text="Threat")
+        tree.heading('risk', text="Risk Level")
+        tree.column('threat', anchor='w')
+        tree.column('risk', anchor='center')
+        tree.pack(fill='both', expand=True)
+        
+        # Threat -> its row id
+        self._threat_iids = {threat: tree.insert('', 'end', values=(threat, "")) for threat in self.THREATS}
     
     def create_buttons(self, parent):
         """Creates the buttons"""
@@ -403,7 +500,7 @@ class RiskAssessmentTool:
         right_frame.pack(side='left', padx=(30, 0))
         
         import_legacy_btn = tk.Button(left_frame, text="IMPORT MISSION ANALYSIS REPORT",
-                                     font=('Segoe UI', 10, 'bold'),
+                                     font=self.get_font(10, 'bold'),
                                      bg='#e74c3c', fg=self.COLORS['white'],
                                      relief='flat', padx=19, pady=0.5,
                                      command=self.import_legacy_report)
@@ -411,7 +508,7 @@ class RiskAssessmentTool:
 
         if DOCX_AVAILABLE:
             export_word_btn = tk.Button(right_frame, text="EXPORT 0-A REPORT",
-                                       font=('Segoe UI', 11, 'bold'),
+                                       font=self.get_font(11, 'bold'),
                                        bg="#27ae60", fg=self.COLORS['white'],
                                        relief='flat', padx=20, pady=12,
                                        command=self.export_to_word,
@@ -419,14 +516,14 @@ class RiskAssessmentTool:
             export_word_btn.pack(pady=(0, 2))
             
             import_word_btn = tk.Button(left_frame, text="IMPORT 0-A REPORT",
-                                       font=('Segoe UI', 10, 'bold'),
+                                       font=self.get_font(10, 'bold'),
                                        bg='#9b59b6', fg=self.COLORS['white'],
                                        relief='flat', padx=67.5, pady=0.5,
                                        command=self.import_from_word)
             import_word_btn.pack(pady=(2, 5))
         else:
             no_docx_label = tk.Label(left_frame, text="Word export/import unavailable\ninstall python-docx",
-                                   font=('Segoe UI', 9),
+                                   font=self.get_font(9),
                                    bg=self.COLORS['white'], fg=self.COLORS['gray'],
                                    justify='center')
             no_docx_label.pack()
@@ -434,15 +531,26 @@ class RiskAssessmentTool:
         
         
         threat_btn = tk.Button(center_frame, text="THREAT ANALYSIS",
-                              font=('Segoe UI', 14, 'bold'),
+                              font=self.get_font(14, 'bold'),
                               bg=self.COLORS['primary'], fg=self.COLORS['white'],
                               relief='flat', padx=40, pady=15,
                               command=self.open_threat_window)
         threat_btn.pack()
     
     def open_threat_window(self):
-        """Open Threat Analysis window"""
-        window = tk.Toplevel(self.root)
+        """Open Threat Analysis window (built on first open, then hidden and reused)"""
+        window = self._threat_window
+        if window is not None and window.winfo_exists():
+            # Start from an empty assessment, as a freshly built window would
+            self.selected_threat_var.set("")
+            self.load_threat_data()
+            self._threat_canvas.yview_moveto(0)
+            window.deiconify()
+            window.lift()
+            window.grab_set()
+            return
+
+        window = self._threat_window = tk.Toplevel(self.root)
         window.title("Threat Analysis")
         window.geometry("1400x800")
         window.configure(bg=self.COLORS['white'])
@@ -455,16 +563,22 @@ class RiskAssessmentTool:
         header.pack_propagate(False)
         
         tk.Label(header, text="Threat Analysis",
-                font=('Segoe UI', 14, 'bold'),
+                font=self.get_font(14, 'bold'),
                 bg=self.COLORS['light'], fg=self.COLORS['dark']).pack(pady=12)
 
         # Main container with scroll
         self.create_threat_content(window)
+        window.protocol("WM_DELETE_WINDOW", self.hide_threat_window)
+
+    def hide_threat_window(self):
+        """Hide the Threat Analysis window instead of destroying it, so the next open reuses it"""
+        self._threat_window.grab_release()
+        self._threat_window.withdraw()
     
     def create_threat_content(self, window):
         """Creates the threat content window"""
         # Scrollable canvas
-        canvas = tk.Canvas(window, bg=self.COLORS['white'])
+        canvas = self._threat_canvas = tk.Canvas(window, bg=self.COLORS['white'])
         scrollbar = tk.Scrollbar(window, orient="vertical", command=canvas.yview)
         content_frame = tk.Frame(canvas, bg=self.COLORS['white'])
         
@@ -482,14 +596,14 @@ class RiskAssessmentTool:
         threat_frame.pack(fill='x', pady=(20, 20))
         
         tk.Label(threat_frame, text="Select Threat:",
-                font=('Segoe UI', 11, 'bold'),
+                font=self.get_font(11, 'bold'),
                 bg=self.COLORS['white'], fg=self.COLORS['dark']).pack(anchor='w')
         
         self.selected_threat_var = tk.StringVar()
         threat_combo = ttk.Combobox(threat_frame,
                                    textvariable=self.selected_threat_var,
                                    values=self.THREATS,
-                                   font=('Segoe UI', 10),
+                                   font=self.get_font(10),
                                    state='readonly')
         threat_combo.pack(fill='x', pady=(5, 0))
         threat_combo.bind('<<ComboboxSelected>>', self.load_threat_data)
@@ -500,37 +614,31 @@ class RiskAssessmentTool:
         # Asset table
         self.create_asset_table(content_frame)
 
-        # Setup mouse wheel for asset table elements
-        self.setup_asset_table_mousewheel(canvas)
-
         # Buttons frame
         buttons_frame = tk.Frame(content_frame, bg=self.COLORS['white'])
         buttons_frame.pack(pady=20)
         
         # Save button
         save_btn = tk.Button(buttons_frame, text="SAVE ASSESSMENT",
-                            font=('Segoe UI', 11, 'bold'),
+                            font=self.get_font(11, 'bold'),
                             bg=self.COLORS['success'], fg=self.COLORS['white'],
                             relief='flat', padx=25, pady=10,
-                            command=lambda: self.save_threat_assessment(window))
+                            command=self.save_threat_assessment)
         save_btn.pack(side='left', padx=(0, 10))
         
         # Help button
         help_btn = tk.Button(buttons_frame, text="❓ Help",
-                            font=('Segoe UI', 11, 'bold'),
+                            font=self.get_font(11, 'bold'),
                             bg=self.COLORS['gray'], fg=self.COLORS['white'],
                             relief='flat', padx=20, pady=10,
                             command=self.show_help)
         help_btn.pack(side='left')
-
-        # Setup global mouse wheel scrolling for the entire content frame
-        self.setup_global_mousewheel(content_frame, canvas)
             
     def create_criteria_table(self, parent):
         """Creates the assessment criteria table"""
         criteria_container = tk.LabelFrame(parent, 
                                          text="Assessment Criteria",
-                                         font=('Segoe UI', 12, 'bold'),
+                                         font=self.get_font(12, 'bold'),
                                          bg=self.COLORS['white'], 
                                          fg=self.COLORS['primary'], 
                                          padx=20, 
@@ -539,53 +647,54 @@ class RiskAssessmentTool:
                                          bd=2)
         criteria_container.pack(fill='x', pady=(0, 20))
 
-        # Creates the cells of the criteria table
+        # The whole matrix is drawn on one Canvas (a rectangle and a wrapped text item per cell)
+        # instead of one Label widget per cell
+        canvas = tk.Canvas(criteria_container, bg=self.COLORS['white'], highlightthickness=0)
+        canvas.pack(fill='x')
+
+        n_rows, n_cols = len(self.CRITERIA_DATA), len(self.CRITERIA_DATA[0])
+        gap, pad, min_col, min_row = 4, 6, 180, 60
+        canvas.configure(width=n_cols * (min_col + gap) - gap)
+
+        cells = []
         for i, row in enumerate(self.CRITERIA_DATA):
-            for j, cell_text in enumerate(row):                    
-                if i == 0:  # Header row                    
-                    cell = tk.Label(criteria_container, text=cell_text,
-                                   font=('Segoe UI', 10, 'bold'),
-                                   bg=self.COLORS['criteria_header'], 
-                                   fg=self.COLORS['white'],
-                                   relief='ridge', 
-                                   bd=1,                                   
-                                   anchor='center',
-                                   justify='center',
-                                   wraplength=180,  
-                                   width=22,        
-                                   height=3,
-                                   padx=3,         
-                                   pady=2)
+            for j, cell_text in enumerate(row):
+                if i == 0:  # Header row
+                    bg, fg = self.COLORS['criteria_header'], self.COLORS['white']
+                    font, anchor, justify = self.get_font(10, 'bold'), 'n', 'center'
                 else:  # Data rows
-                    
-                    font_weight = 'bold' if j == 0 else 'normal'                        
-                    cell = tk.Label(criteria_container, text=cell_text,
-                                   font=('Segoe UI', 9, font_weight),
-                                   bg=self.COLORS['criteria_bg'],
-                                   fg=self.COLORS['dark'],
-                                   relief='ridge',
-                                   bd=1,
-                                   anchor='nw',
-                                   justify='left',
-                                   wraplength=180,  
-                                   width=22,        
-                                   height=4,        
-                                   padx=6,          
-                                   pady=3)          
-                
-                cell.grid(row=i, column=j, padx=2, pady=2, sticky='ew', ipady=5)
-
-        # Grid configuration with uniform column sizes
-        for j in range(6):
-            criteria_container.grid_columnconfigure(j, weight=1, minsize=180, uniform="criteria_cols")  
-        
-        for i in range(6):  # 5 data rows + 1 header
-            criteria_container.grid_rowconfigure(i, minsize=60, uniform="criteria_rows")  
+                    bg, fg = self.COLORS['criteria_bg'], self.COLORS['dark']
+                    font = self.get_font(9, 'bold' if j == 0 else 'normal')
+                    anchor, justify = 'nw', 'left'
+                rect = canvas.create_rectangle(0, 0, 0, 0, fill=bg, outline=self.COLORS['gray'])
+                text = canvas.create_text(0, 0, text=cell_text, fill=fg, font=font,
+                                          anchor=anchor, justify=justify)
+                cells.append((i, j, rect, text, anchor))
+
+        layout_width = [None]
+
+        def layout(event):
+            """Stretch the columns to the canvas width and give every row the height of the tallest"""
+            if event.width == layout_width[0]:
+                return
+            layout_width[0] = event.width
+            col_width = max(min_col, (event.width - gap * (n_cols - 1)) / n_cols)
+            texts = [cell[3] for cell in cells]
+            for text in texts:
+                canvas.itemconfigure(text, width=col_width - 2 * pad)
+            row_height = max(min_row, max(y2 - y1 for _, y1, _, y2 in map(canvas.bbox, texts)) + 2 * pad)
+            for i, j, rect, text, anchor in cells:
+                x, y = j * (col_width + gap), i * (row_height + gap)
+                canvas.coords(rect, x, y, x + col_width, y + row_height)
+                canvas.coords(text, x + (col_width / 2 if anchor == 'n' else pad), y + pad)
+            canvas.configure(height=n_rows * (row_height + gap) - gap)
+
+        canvas.bind('<Configure>', layout)
     
     def create_asset_table(self, parent):
         """Creates the asset assessment table"""
         table_frame = tk.LabelFrame(parent, text="Asset Assessment (Values 1-5)",
-                                   font=('Segoe UI', 11, 'bold'),
+                                   font=self.get_font(11, 'bold'),
                                    bg=self.COLORS['white'], fg=self.COLORS['primary'],
                                    padx=15, pady=15)        
         table_frame.pack(fill='both', expand=True)
@@ -595,478 +704,316 @@ class RiskAssessmentTool:
                   "Operational Impact", "Recovery", "Likelihood", "Impact", "Risk"]
         
         for j, header in enumerate(headers):
-            cell = tk.Label(table_frame, text=header,
-                           font=('Segoe UI', 10, 'bold'),
-                           bg=self.COLORS['primary'], fg=self.COLORS['white'],
-                           relief='ridge', bd=1, width=12)
+            cell = ttk.Label(table_frame, text=header, style='AssetHeader.TLabel', width=12)
             cell.grid(row=0, column=j, padx=1, pady=1, sticky='ew')
         
         # Reset storage
         self.impact_entries = {}
         self.combo_vars = {}
+        self._calc_vars = {}  # Asset key -> (Likelihood, Impact, Risk) StringVars shown by the computed labels
+        self._calc_levels = {}  # Asset key -> [Likelihood, Impact, Risk] RISK_LEVELS indexes of those cells, -1 if empty
+        self._asset_row_for_key = {}  # Asset key -> row index into _row_values
+        self._row_values = []  # Current score strings of every asset row, kept in sync by the traces
+        self._score_index = {}  # Tcl variable name -> (row, column) in _row_values
+        score_values = ("", "1", "2", "3", "4", "5")  # Shared by every score combobox
         
         # Assessment Rows - Dynamic based on loaded asset categories
         for i in range(len(self.ASSET_CATEGORIES)):
             category, subcategory = self.ASSET_CATEGORIES[i]
             asset_key = f"{i+1}_probability"  # Unique key for asset
             # Category (read-only)
-            cat_cell = tk.Label(table_frame, text=category,
-                               font=('Segoe UI', 9, 'bold'),
-                               bg=self.COLORS['light'], fg=self.COLORS['dark'],
-                               relief='ridge', bd=1, width=10)
+            cat_cell = ttk.Label(table_frame, text=category, style='AssetCategory.TLabel', width=10)
             cat_cell.grid(row=i+1, column=0, padx=1, pady=1, sticky='ew')
             
             # Sub-Category (read-only)
-            sub_cell = tk.Label(table_frame, text=subcategory,
-                               font=('Segoe UI', 9),
-                               bg=self.COLORS['light'], fg=self.COLORS['dark'],
-                               relief='ridge', bd=1, width=15)
+            sub_cell = ttk.Label(table_frame, text=subcategory, style='AssetCell.TLabel', width=15)
             sub_cell.grid(row=i+1, column=1, padx=1, pady=1, sticky='ew')
 
             # Storage for this row
             row_entries = {}
             self.combo_vars[asset_key] = {}
+            self._asset_row_for_key[asset_key] = i
+            self._row_values.append([""] * 5)
+            
+            # One trace callback per row and output, shared by the comboboxes feeding it
+            likelihood_trace = partial(self.schedule_recalc, asset_key, self._pending_likelihood)
+            impact_trace = partial(self.schedule_recalc, asset_key, self._pending_impact)
             
             # Writable columns (2-6: Vulnerability, Detection Probability, Defense Capability, Operational Impact, Recovery)
             for j in range(2, 7):
                 combo_var = tk.StringVar(value="")                
-                combo = ttk.Combobox(table_frame,
-                                    textvariable=combo_var,
-                                    values=["", "1", "2", "3", "4", "5"],
-                                    font=('Segoe UI', 9),
-                                    width=8, state='readonly')
+                # Read-only Spinbox: lighter than a Combobox, and leaves the wheel to the window scroll
+                combo = tk.Spinbox(table_frame,
+                                   textvariable=combo_var,
+                                   values=score_values,
+                                   font=self.get_font(9),
+                                   width=8, state='readonly', wrap=True, justify='center',
+                                   readonlybackground=self.COLORS['white'])
                 combo.grid(row=i+1, column=j, padx=1, pady=1, sticky='ew')
                 
-                # Disable mouse wheel on combobox
-                self.disable_mousewheel_on_combobox(combo)
-                
                 row_entries[j-2] = combo  # 0-based index
                 self.combo_vars[asset_key][j-2] = combo_var
+                self._score_index[str(combo_var)] = (i, j-2)
 
                 # Bind calculations
                 if j <= 4:  # Vulnerability, Detection Probability, Defense Capability -> Likelihood
-                    combo_var.trace_add('write', lambda *args, key=asset_key: self.calculate_likelihood(key))
+                    combo_var.trace_add('write', likelihood_trace)
                 elif j <= 6:  # Operational Impact, Recovery -> Impact
-                    combo_var.trace_add('write', lambda *args, key=asset_key: self.calculate_impact(key))
+                    combo_var.trace_add('write', impact_trace)
             # Colonne calcolate (7-9: Likelihood, Impact, Risk) - read-only
+            calc_vars = []
             for j in range(7, 10):
-                calc_cell = tk.Label(table_frame, text="",
-                                   font=('Segoe UI', 9),
-                                   bg=self.COLORS['light'], fg=self.COLORS['dark'],
-                                   relief='ridge', bd=1, width=10)
+                calc_var = tk.StringVar(value="")
+                calc_vars.append(calc_var)
+                calc_cell = ttk.Label(table_frame, textvariable=calc_var, style='AssetCell.TLabel', width=10)
                 calc_cell.grid(row=i+1, column=j, padx=1, pady=1, sticky='ew')
                 row_entries[j-2] = calc_cell
             
             self.impact_entries[asset_key] = row_entries        
-        # Column 0 (Category):
-        table_frame.grid_columnconfigure(0, weight=1, minsize=120, uniform="small_cols")
+            self._calc_vars[asset_key] = tuple(calc_vars)
+            self._calc_levels[asset_key] = [-1, -1, -1]
+        # Column 0 (Category) and columns 2-9, configured in one call
+        table_frame.grid_columnconfigure((0, *range(2, 10)), weight=1, minsize=120, uniform="small_cols")
         # Column 1 (Sub-Category): 
         table_frame.grid_columnconfigure(1, weight=1, minsize=180, uniform="sub_category_col")
-        # Columns 2-9:
-        for j in range(2, 10):
-            table_frame.grid_columnconfigure(j, weight=1, minsize=120, uniform="small_cols")
         
-        for i in range(10):  # 9 data rows + 1 header
-            table_frame.grid_rowconfigure(i, minsize=40, uniform="rows")
+        # Header + one row per asset category, configured in one call
+        table_frame.grid_rowconfigure(tuple(range(len(self.ASSET_CATEGORIES) + 1)), minsize=40, uniform="rows")
     
+    def schedule_recalc(self, key, pending, var_name, *trace_args):
+        """Store the new score and queue the asset for recalculation; a burst of writes is handled in one idle pass"""
+        row, col = self._score_index[var_name]
+        self._row_values[row][col] = self.root.getvar(var_name).strip()
+        if self._loading_threat:
+            return  # load_threat_data recalculates all assets itself
+        pending.add(key)
+        if not self._recalc_pending:
+            self._recalc_pending = True
+            self.root.after_idle(self._do_recalc)
+
+    def _do_recalc(self):
+        """Recalculate the queued assets, then refresh the main table once"""
+        self._recalc_pending = False
+        for key in self._pending_likelihood:
+            self.calculate_likelihood(key)
+        for key in self._pending_impact:
+            self.calculate_impact(key)
+        self._pending_likelihood.clear()
+        self._pending_impact.clear()
+
+        # Update main table in real-time
+        self.update_main_table_risk_realtime()
+
     def calculate_likelihood(self, key):
         """Calculates Likelihood using quadratic mean of three criteria"""
-        if key not in self.combo_vars:
+        row = self._asset_row_for_key.get(key)
+        if row is None:
             return
 
         # Get values Vulnerability, Detection Probability, Defense Capability (columns 0,1,2)
-        values = []
-        for col_idx in [0, 1, 2]:
-            if col_idx not in self.combo_vars[key]:
-                continue
-                self.update_display(key, 5, "")  # Likelihood column
-                return
-            
-            value_str = self.combo_vars[key][col_idx].get().strip()
-            if not value_str or value_str == "0":
-                continue
-                self.update_display(key, 5, "")
-                return
-            
-            try:
-                values.append(float(value_str))
-            except ValueError:
-                self.update_display(key, 5, "")
-                return
-        
-        if len(values) == 0:
+        scores = tuple(value_str for value_str in self._row_values[row][0:3] if value_str and value_str != "0")
+        if not scores:
             self.update_display(key, 5, "")
             self.update_display(key, 7, "")
             return
 
-        # Calculate Likelihood using quadratic mean
-        quadratic_mean = math.sqrt(sum(x**2 for x in values) / len(values))
-        likelihood = (quadratic_mean - 1) / 4  # Normalize [1,5] -> [0,1]
-        likelihood = max(0.0, min(1.0, likelihood))
+        # Likelihood level from the quadratic mean
+        try:
+            level = self.scores_to_level(scores)
+        except ValueError:
+            self.update_display(key, 5, "")
+            return
 
         # Update display with category instead of numeric value
-        likelihood_category = self.value_to_category(likelihood)
-        self.update_display(key, 5, likelihood_category)  # Likelihood column
+        self.update_display(key, 5, RISK_LEVELS[level])  # Likelihood column
 
         # Recalculate risk if Impact is also available
         self.calculate_risk(key)
 
-        # Update main table in real-time also for likelihood
-        self.update_main_table_risk_realtime()
-
-    def get_saved_likelihood(self, threat_name, asset_num):
-        """Get saved likelihood for specific threat/asset using only base calculation"""
-        if threat_name not in self.threat_data:
-            return 0.0
-        
-        asset_key = f"{asset_num}_probability"
-        if asset_key not in self.threat_data[threat_name]:
-            return 0.0
-        
-        row_data = self.threat_data[threat_name][asset_key]
-        
-        try:
-            # Check values for Vulnerability, Detection Probability, Defense Capability
-            if not isinstance(row_data, dict):
-                return 0.0
-            
-            values = []
-            for i in [0, 1, 2]:  # Vulnerability, Detection Probability, Defense Capability
-                if str(i) not in row_data:
-                    return 0.0
-                val = row_data[str(i)]
-                if not val or val == "0":
-                    return 0.0
-                values.append(float(val))
-            
-            if len(values) == 3:
-                # Calculate base likelihood using quadratic mean
-                quadratic_mean = math.sqrt(sum(x**2 for x in values) / 3)
-                likelihood = (quadratic_mean - 1) / 4  # Normalize [1,5] -> [0,1]
-                return max(0.0, min(1.0, likelihood))
-        
-        except (ValueError, KeyError, TypeError):
-            pass
-        
-        return 0.0
-    
     def calculate_impact(self, key):
         """Calculates Impact as the quadratic mean of Operational Impact and Recovery Time"""
-        if key not in self.combo_vars:
+        row = self._asset_row_for_key.get(key)
+        if row is None:
             return
 
         # Get Operational Impact, Recovery values (columns 3,4)
-        values = []
-        for col_idx in [3, 4]:
-            if col_idx not in self.combo_vars[key]:
-                continue
-                self.update_display(key, 6, "")  # Impact column
-                return
-            
-            value_str = self.combo_vars[key][col_idx].get().strip()
-            if not value_str or value_str == "0":
-                continue
-                self.update_display(key, 6, "")
-                return
-            
-            try:
-                values.append(float(value_str))
-            except ValueError:
-                self.update_display(key, 6, "")
-                return
-            
-        if len(values) == 0:
+        scores = tuple(value_str for value_str in self._row_values[row][3:5] if value_str and value_str != "0")
+        if not scores:
             self.update_display(key, 6, "")
             self.update_display(key, 7, "")
             return
-        # Quadratic mean normalized
-        quadratic_mean = math.sqrt(sum(x**2 for x in values) / len(values))
-        impact = (quadratic_mean - 1) / 4  # [1,5] -> [0,1]
-        impact = max(0.0, min(1.0, impact))
+
+        # Impact level from the quadratic mean
+        try:
+            level = self.scores_to_level(scores)
+        except ValueError:
+            self.update_display(key, 6, "")
+            return
 
         # Update display with category instead of numeric value
-        impact_category = self.value_to_category(impact)
-        self.update_display(key, 6, impact_category)  # Impact column
+        self.update_display(key, 6, RISK_LEVELS[level])  # Impact column
 
         # Recalculate risk
         self.calculate_risk(key)
 
     def calculate_risk(self, key):
         """Calculates Risk using the Likelihood x Impact matrix"""
-        if key not in self.impact_entries:
+        levels = self._calc_levels.get(key)
+        if levels is None:
             return
 
-        # Get Likelihood and Impact (now they are already categories)
-        likelihood_widget = self.impact_entries[key][5]  # Likelihood column
-        impact_widget = self.impact_entries[key][6]      # Impact column
-        
-        likelihood_cat = likelihood_widget.cget('text') if hasattr(likelihood_widget, 'cget') else ""
-        impact_cat = impact_widget.cget('text') if hasattr(impact_widget, 'cget') else ""
-        
-        if not likelihood_cat or not impact_cat:
+        # Get Likelihood and Impact levels (as last displayed)
+        likelihood_index, impact_index, _ = levels
+        if likelihood_index < 0 or impact_index < 0:
             self.update_display(key, 7, "")  # Risk column
             return
 
-        # Check if they are valid categories
-        valid_categories = ["Very Low", "Low", "Medium", "High", "Very High"]
-        if likelihood_cat in valid_categories and impact_cat in valid_categories:
-            # Get risk from matrix
-            risk_level = self.RISK_MATRIX.get((likelihood_cat, impact_cat), "")
-            self.update_display(key, 7, risk_level)  # Risk column
-
-            # Update main table in real-time
-            self.update_main_table_risk_realtime()
-        else:
-            self.update_display(key, 7, "")
+        # Get risk from matrix
+        risk_level = RISK_LEVELS[RISK_INDEX_MATRIX[likelihood_index][impact_index]]
+        self.update_display(key, 7, risk_level)  # Risk column
     
-    def value_to_category(self, value):
-        """Converts numeric value to category"""
-        if value <= 0.1:
-            return "Very Low"
-        elif value <= 0.4:
-            return "Low"
-        elif value <= 0.7:
-            return "Medium"
-        elif value <= 0.9:
-            return "High"
-        else:
-            return "Very High"
+    def scores_to_level(self, scores):
+        """RISK_LEVELS index of the quadratic mean of a tuple of score strings; raises ValueError on a non-numeric score"""
+        level = QUADRATIC_MEAN_LEVELS.get(scores)
+        if level is None:
+            # Not plain 1-5 scores (e.g. imported values): compute it
+            level = score_level(normalized_quadratic_mean([float(value_str) for value_str in scores]))
+        return level
     
     def update_display(self, key, col_index, value):
-        """Updates the display of a cell"""
-        if key in self.impact_entries and col_index in self.impact_entries[key]:
-            widget = self.impact_entries[key][col_index]
-            if hasattr(widget, 'config'):
-                widget.config(text=value)
+        """Updates the display of a computed cell (5: Likelihood, 6: Impact, 7: Risk)"""
+        calc_vars = self._calc_vars.get(key)
+        if calc_vars is not None and 5 <= col_index <= 7:
+            calc_vars[col_index - 5].set(value)
+            self._calc_levels[key][col_index - 5] = RISK_LEVEL_INDEX.get(value, -1)
     
     def load_threat_data(self, event=None):
         """Loads data for selected threat"""
         selected_threat = self.selected_threat_var.get()
 
-        # Clear all fields
-        for key in self.impact_entries:
-            self.clear_asset_data(key)
+        # Saved data if it exists (empty otherwise, which clears all fields)
+        threat_data = self.threat_data.get(selected_threat, {}) if selected_threat else {}
 
-        # Load data if it exists
-        if selected_threat and selected_threat in self.threat_data:
-            threat_data = self.threat_data[selected_threat]
-            
-            for key, row_data in threat_data.items():
-                if key in self.combo_vars:
-                    for col_idx, value in row_data.items():
-                        if int(col_idx) in self.combo_vars[key]:
-                            self.combo_vars[key][int(col_idx)].set(value)
+        # Set every combobox exactly once, with the traces muted; everything is recalculated below
+        self._loading_threat = True
+        try:
+            for key, row_vars in self.combo_vars.items():
+                row_data = threat_data.get(key, {})
+                for col_idx, combo_var in row_vars.items():
+                    combo_var.set(row_data.get(str(col_idx), ""))
+        finally:
+            self._loading_threat = False
 
         # Recalculate everything
         for key in self.impact_entries:
             self.calculate_likelihood(key)
             self.calculate_impact(key)
+        self.update_main_table_risk_realtime()
     
-    def clear_asset_data(self, key):
-        """Clears data for an asset"""
-        if key in self.combo_vars:
-            for combo_var in self.combo_vars[key].values():
-                combo_var.set("")
-        
-        if key in self.impact_entries:
-            for col_idx in [5, 6, 7]:  # Likelihood, Impact, Risk
-                if col_idx in self.impact_entries[key]:
-                    self.update_display(key, col_idx, "")
-    def save_threat_assessment(self, window):
+    def save_threat_assessment(self):
         """Saves current threat assessment"""
         selected_threat = self.selected_threat_var.get()
         if not selected_threat:
             messagebox.showwarning("Warning", "Please select a threat first!")
             return
 
-        # Collect data
+        # Collect data (from the in-memory scores, no Tk variable reads)
         threat_data = {}
-        for key in self.combo_vars:
-            row_data = {}
-            for col_idx, combo_var in self.combo_vars[key].items():
-                value = combo_var.get().strip()
-                if value:
-                    row_data[str(col_idx)] = value
-            
+        for key, row in self._asset_row_for_key.items():
+            row_data = {str(col_idx): value for col_idx, value in enumerate(self._row_values[row]) if value}
             if row_data:
                 threat_data[key] = row_data
         
         # Save data
         self.threat_data[selected_threat] = threat_data
 
-        # Update main table with maximum risks of ALL threats
-        self.update_all_threats_in_main_table()
+        # Update main table with maximum risks of ALL threats (only this one is recalculated)
+        self.update_all_threats_in_main_table(selected_threat)
         
         messagebox.showinfo("Success", f"Assessment for '{selected_threat}' saved!")
-        window.destroy()
+        self.hide_threat_window()
     
     def update_main_table_risk(self, threat_name):
         """Updates main table with maximum risk"""
-        if threat_name not in self.threat_data or threat_name not in self.threat_cells:
+        if threat_name not in self.threat_data or threat_name not in self._threat_iids:
             return
 
-        # Find maximum risk among all assets
-        risk_priorities = {"Very High": 5, "High": 4, "Medium": 3, "Low": 2, "Very Low": 1, "": 0}
-        max_risk = ""
-        max_priority = 0
-
-        # Check all assets
-        for key in self.impact_entries:
-            risk_widget = self.impact_entries[key].get(7)  # Risk column
-            if risk_widget and hasattr(risk_widget, 'cget'):
-                risk_text = risk_widget.cget('text')
-                priority = risk_priorities.get(risk_text, 0)
-                if priority > max_priority:
-                    max_priority = priority
-                    max_risk = risk_text        # Update main table
-        self.threat_cells[threat_name].config(text=max_risk)
+        # Find maximum risk among all assets, update main table
+        self._threat_tree.set(self._threat_iids[threat_name], 'risk', self.get_displayed_max_risk())
+    
+    def get_displayed_max_risk(self):
+        """Highest Risk level shown in the asset table ("" when no risk is shown)"""
+        max_level = max((levels[2] for levels in self._calc_levels.values()), default=-1)  # Risk column
+        return RISK_LEVELS[max_level] if max_level >= 0 else ""
     
-    def update_all_threats_in_main_table(self):
-        """Updates main table with maximum risks of all saved threats"""
-        risk_priorities = {"Very High": 5, "High": 4, "Medium": 3, "Low": 2, "Very Low": 1, "": 0}
+    def update_all_threats_in_main_table(self, changed_threat=None):
+        """Updates main table with maximum risks of all saved threats
+
+        Only changed_threat is recalculated when given; otherwise (after an import) every threat is.
+        """
+        if changed_threat is None:
+            self._threat_risk_cache.clear()
+        else:
+            self._threat_risk_cache.pop(changed_threat, None)
 
         # For each threat that has saved data
-        for threat_name in self.threat_data.keys():
-            if threat_name not in self.threat_cells:
+        for threat_name in self.threat_data:
+            if threat_name not in self._threat_iids:
                 continue
-            
-            max_risk = ""
-            max_priority = 0
-
-            # Calculate maximum risk for this threat
-            threat_data = self.threat_data[threat_name]
-            
-            for asset_key, asset_data in threat_data.items():
-                # Calculate likelihood for this asset
-                likelihood = self.calculate_likelihood_from_saved_data(threat_name, asset_key, asset_data)
-
-                # Calculate impact for this asset
-                impact = self.calculate_impact_from_saved_data(asset_data)
-
-                # Calculate risk if both are available
-                if likelihood >= 0 and impact >= 0:
-                    likelihood_cat = self.value_to_category(likelihood)
-                    impact_cat = self.value_to_category(impact)
-                    risk_level = self.RISK_MATRIX.get((likelihood_cat, impact_cat), "")
-                    
-                    priority = risk_priorities.get(risk_level, 0)
-                    if priority > max_priority:
-                        max_priority = priority
-                        max_risk = risk_level
 
             # Update main table for this threat
-            self.threat_cells[threat_name].config(text=max_risk)
+            self._threat_tree.set(self._threat_iids[threat_name], 'risk', self.get_saved_max_risk(threat_name))
+
+    def get_saved_max_risk(self, threat_name):
+        """Maximum risk of the saved data of a threat, cached until update_all_threats_in_main_table invalidates it"""
+        max_risk = self._threat_risk_cache.get(threat_name)
+        if max_risk is None:
+            max_risk = self._threat_risk_cache[threat_name] = self.get_max_risk_for_threat(threat_name)
+        return max_risk
 
-    def calculate_likelihood_from_saved_data(self, threat_name, asset_key, asset_data):
-        """Calculates likelihood from saved data using quadratic mean"""
-        try:
-            # Check if necessary values are present (Vulnerability, Detection Probability, Defense Capability)
-            if not all(str(i) in asset_data for i in [0, 1, 2]):
-                return 0.0
-            
-            values = []
-            for i in [0, 1, 2]:
-                val = asset_data[str(i)]
-                if not val or val == "0":
-                    return 0.0
-                values.append(float(val))
-            
-            if len(values) == 3:
-                # Calculate likelihood using quadratic mean
-                quadratic_mean = math.sqrt(sum(x**2 for x in values) / 3)
-                likelihood = (quadratic_mean - 1) / 4  # Normalize [1,5] -> [0,1]
-                return max(0.0, min(1.0, likelihood))
-        
-        except (ValueError, KeyError, TypeError):
-            pass
-        
-        return 0.0
-    def calculate_impact_from_saved_data(self, asset_data):
-        """Calculates impact from saved data using quadratic mean"""
-        try:
-            # Check if necessary values are present (Operational Impact, Recovery)
-            if not all(str(i) in asset_data for i in [3, 4]):
-                return 0.0
-            
-            values = []
-            for i in [3, 4]:  # Operational Impact, Recovery
-                val = asset_data[str(i)]
-                if not val or val == "0":
-                    return 0.0
-                values.append(float(val))
-            
-            if len(values) == 2:
-                # Quadratic mean normalized
-                quadratic_mean = math.sqrt(sum(x**2 for x in values) / 2)
-                impact = (quadratic_mean - 1) / 4  # [1,5] -> [0,1]
-                return max(0.0, min(1.0, impact))
-        
-        except (ValueError, KeyError, TypeError):
-            pass
-        
-        return 0.0
-    
     def update_main_table_risk_realtime(self):
         """Updates main table in real-time during calculations"""
         current_threat = self.selected_threat_var.get()
-        if not current_threat or current_threat not in self.threat_cells:
+        if not current_threat or current_threat not in self._threat_iids:
             return
         
         # Find maximum risk among all currently displayed assets
-        risk_priorities = {"Very High": 5, "High": 4, "Medium": 3, "Low": 2, "Very Low": 1, "": 0}
-        max_risk = ""
-        max_priority = 0
-        
-        # Check all currently displayed assets
-        for key in self.impact_entries:
-            risk_widget = self.impact_entries[key].get(7)  # Risk column
-            if risk_widget and hasattr(risk_widget, 'cget'):
-                risk_text = risk_widget.cget('text')
-                priority = risk_priorities.get(risk_text, 0)
-                if priority > max_priority:
-                    max_priority = priority
-                    max_risk = risk_text
+        max_risk = self.get_displayed_max_risk()
 
         # Update main table in real time
         if max_risk:
-            self.threat_cells[current_threat].config(text=max_risk)
+            self._threat_tree.set(self._threat_iids[current_threat], 'risk', max_risk)
     
     def get_max_risk_for_threat(self, threat_name):
         """Calculates the maximum risk for a specific threat"""
         if threat_name not in self.threat_data:
             return ""
         
-        risk_priorities = {"Very High": 5, "High": 4, "Medium": 3, "Low": 2, "Very Low": 1, "": 0}
-        max_risk = ""
-        max_priority = 0
-
-        # Calculate maximum risk for this threat
-        threat_data = self.threat_data[threat_name]
+        # Calculate maximum risk level index for this threat (-1: no assessed asset)
+        max_level = -1
+        for asset_data in self.threat_data[threat_name].values():
+            likelihood_level = self.saved_scores_level(asset_data, ("0", "1", "2"))  # Vulnerability, Detection, Defense
+            impact_level = self.saved_scores_level(asset_data, ("3", "4"))  # Operational Impact, Recovery
+            max_level = max(max_level, RISK_INDEX_MATRIX[likelihood_level][impact_level])
+            if max_level == 4:
+                break  # Very High cannot be exceeded
         
-        for asset_key, asset_data in threat_data.items():
-            # Calculate likelihood for this asset
-            likelihood = self.calculate_likelihood_from_saved_data(threat_name, asset_key, asset_data)
-
-            # Calculate impact for this asset
-            impact = self.calculate_impact_from_saved_data(asset_data)
+        return RISK_LEVELS[max_level] if max_level >= 0 else ""
 
-            # Calculate risk if both are available
-            if likelihood >= 0 and impact >= 0:
-                likelihood_cat = self.value_to_category(likelihood)
-                impact_cat = self.value_to_category(impact)
-                risk_level = self.RISK_MATRIX.get((likelihood_cat, impact_cat), "")
-                
-                priority = risk_priorities.get(risk_level, 0)
-                if priority > max_priority:
-                    max_priority = priority
-                    max_risk = risk_level
-        
-        return max_risk
+    def saved_scores_level(self, asset_data, columns):
+        """RISK_LEVELS index of saved scores, Very Low unless every column holds a non-zero score"""
+        try:
+            scores = tuple(asset_data[column] for column in columns)
+            if not all(score and score != "0" for score in scores):
+                return 0
+            return self.scores_to_level(scores)
+        except (ValueError, KeyError, TypeError):
+            return 0
 
     # ===== WORD EXPORT/IMPORT METHODS =====
     def export_to_word(self):
         """Exports the risk assessment to a Word document"""
-        if not DOCX_AVAILABLE:
+        if not load_docx():
             messagebox.showerror("Error", "python-docx library not available!\nInstall with: pip install python-docx")
             return
             
@@ -1106,7 +1053,7 @@ class RiskAssessmentTool:
             messagebox.showerror("Error", f"Error exporting to Word:\n{str(e)}")
     def import_from_word(self):
         """Import data from a previously exported Word document"""
-        if not DOCX_AVAILABLE:
+        if not load_docx():
             messagebox.showerror("Error", "python-docx library not available!\nInstall with: pip install python-docx")
             return
             
@@ -1134,7 +1081,7 @@ class RiskAssessmentTool:
     
     def import_legacy_report(self):
         """Import data from a legacy Word report"""
-        if not DOCX_AVAILABLE:
+        if not load_docx():
             messagebox.showerror("Error", "python-docx library not available!\nInstall with: pip install python-docx")
             return
             
@@ -1159,47 +1106,48 @@ class RiskAssessmentTool:
             
             # Clear existing data
             self.threat_data = {}
+            self._threat_risk_cache.clear()
             
             # Import the parsed data into our data structure
             for threat_name, threat_info in threats_data.items():
-                if threat_name in self.THREATS:
+                if threat_name in self.THREAT_INDEX:
                     likelihood = threat_info['likelihood']
                     asset_categories = threat_info['assets']
                     
                     # Create threat data structure
                     threat_data = {}
                     
+                    # Set minimal data to create a valid likelihood
+                    # We'll use default values for Vulnerability, Access, Defense
+                    # but set them to produce the desired likelihood (same for every asset of the threat)
+                    likelihood_val = self.category_to_value(likelihood)
+                    base_val = self.likelihood_to_base_value(likelihood_val)
+                    
+                    # Use base_val - 1 for better calibration
+                    adjusted_val = max(1, base_val)
+                    
                     # For each asset category mentioned in the legacy report
                     for asset_category in asset_categories:
-                        # Find the corresponding asset index in our ASSET_CATEGORIES
-                        for i, (main_cat, sub_cat) in enumerate(self.ASSET_CATEGORIES):
-                            if asset_category in sub_cat or asset_category in main_cat:
-                                asset_key = f"{i+1}_probability"
-                                
-                                # Set minimal data to create a valid likelihood
-                                # We'll use default values for Vulnerability, Access, Defense
-                                # but set them to produce the desired likelihood
-                                likelihood_val = self.category_to_value(likelihood)
-                                base_val = self.likelihood_to_base_value(likelihood_val)
-                                
-                                # Use base_val - 1 for better calibration
-                                adjusted_val = max(1, base_val)
-                                if threat_name == "Jamming" or threat_name == "Tainted hardware components":
-                                    threat_data[asset_key] = {
-                                        '0': str(adjusted_val),  # Vulnerability
-                                        '1': '',  # Access Control
-                                        '2': str(adjusted_val),  # Defense Capability
-                                        '3': '3',  # Operational Impact (medium)
-                                        '4': '3'   # Recovery Time (medium)
+                        # Every asset of our ASSET_CATEGORIES whose names contain it
+                        for i in self.legacy_asset_indices(asset_category):
+                            asset_key = f"{i+1}_probability"
+                            
+                            if threat_name == "Jamming" or threat_name == "Tainted hardware components":
+                                threat_data[asset_key] = {
+                                    '0': str(adjusted_val),  # Vulnerability
+                                    '1': '',  # Access Control
+                                    '2': str(adjusted_val),  # Defense Capability
+                                    '3': '3',  # Operational Impact (medium)
+                                    '4': '3'   # Recovery Time (medium)
+                            }
+                            else:
+                                threat_data[asset_key] = {
+                                    '0': str(adjusted_val),  # Vulnerability
+                                    '1': str(adjusted_val),  # Access Control
+                                    '2': str(adjusted_val),  # Defense Capability
+                                    '3': '3',  # Operational Impact (medium)
+                                    '4': '3'   # Recovery Time (medium)
                                 }
-                                else:
-                                    threat_data[asset_key] = {
-                                        '0': str(adjusted_val),  # Vulnerability
-                                        '1': str(adjusted_val),  # Access Control
-                                        '2': str(adjusted_val),  # Defense Capability
-                                        '3': '3',  # Operational Impact (medium)
-                                        '4': '3'   # Recovery Time (medium)
-                                    }
                     
                     if threat_data:
                         self.threat_data[threat_name] = threat_data
@@ -1214,62 +1162,49 @@ class RiskAssessmentTool:
         except Exception as e:
             messagebox.showerror("Error", f"Error importing legacy report:\n{str(e)}")
     
+    def legacy_asset_indices(self, asset_category):
+        """Row indexes of the asset categories whose category or sub-category contains a legacy report name"""
+        indices = self._legacy_asset_matches.get(asset_category)
+        if indices is None:
+            indices = self._legacy_asset_matches[asset_category] = tuple(
+                i for i, (main_cat, sub_cat) in enumerate(self.ASSET_CATEGORIES)
+                if asset_category in sub_cat or asset_category in main_cat)
+        return indices
+    
     def parse_legacy_report(self, content):
         """Parse a legacy text report and extract threat probability data"""
         threats_data = {}
         
         try:
-            # Look for the "Main Threats Overview" section
-            lines = content.split('\n')
-            in_main_threats_section = False
+            # Only the "Main Threats Overview" section, up to the detailed analysis or the risk matrix
+            start = content.find('Main Threats Overview')
+            if start < 0:
+                return threats_data
+            start = content.find('\n', start) + 1
+            if start == 0:
+                return threats_data
+            ends = [end for end in (content.find('Detailed Threat Analysis', start), content.find('Risk Matrix', start))
+                    if end >= 0]
+            section = content[start:min(ends)] if ends else content[start:]
             
-            for line in lines:
-                line = line.strip()
+            # Threat lines: "| Threat Name | Probability |" (separator rows fail the checks below)
+            for line in section.split('\n'):
+                # Skip non-table lines, a repeated section title and header lines
+                if '|' not in line or 'Main Threats Overview' in line or ('Threat' in line and 'Probability' in line):
+                    continue
                 
-                # Check if we're entering the Main Threats Overview section
-                if 'Main Threats Overview' in line:
-                    in_main_threats_section = True
+                # First two non-empty cells
+                parts = [part for part in map(str.strip, line.split('|')) if part]
+                if len(parts) < 2:
                     continue
+                threat_name, probability = parts[0], parts[1]
                 
-                # Check if we're leaving the main threats section (entering detailed analysis)
-                if in_main_threats_section and ('Detailed Threat Analysis' in line or 'Risk Matrix' in line):
-                    break
+                # Normalize probability
+                probability = LEGACY_PROBABILITY_ALIASES.get(probability, probability)
                 
-                # If we're in the main threats section, look for threat data
-                if in_main_threats_section and '|' in line:
-                    # Skip header lines
-                    if 'Threat' in line and 'Probability' in line:
-                        continue
-                    if line.startswith('|--') or line.startswith('---'):
-                        continue
-                    
-                    # Parse threat line: "| Threat Name | Probability |"
-                    parts = [part.strip() for part in line.split('|') if part.strip()]
-                    
-                    if len(parts) >= 2:
-                        threat_name = parts[0].strip()
-                        probability = parts[1].strip()
-                        
-                        # Map probability values to our standard values
-                        probability_mapping = {
-                            'Very Low': 'Very Low',
-                            'Low': 'Low',
-                            'Medium': 'Medium',
-                            'High': 'High',
-                            'Very High': 'Very High',
-                            'VL': 'Very Low',
-                            'L': 'Low',
-                            'M': 'Medium',
-                            'H': 'High',
-                            'VH': 'Very High'
-                        }
-                        
-                        # Normalize probability
-                        probability = probability_mapping.get(probability, probability)
-                        
-                        # Only add if it's a valid threat name from our list
-                        if threat_name in self.THREATS and probability in ['Very Low', 'Low', 'Medium', 'High', 'Very High']:
-                            threats_data[threat_name] = probability
+                # Only add if it's a valid threat name from our list
+                if threat_name in self.THREAT_INDEX and probability in RISK_LEVEL_INDEX:
+                    threats_data[threat_name] = probability
             
         except Exception as e:
             print(f"Error parsing legacy report: {e}")
@@ -1318,7 +1253,7 @@ class RiskAssessmentTool:
             row_cells[0].text = threat
 
             # Calculate maximum risk for this threat
-            max_risk = self.get_max_risk_for_threat(threat)
+            max_risk = self.get_saved_max_risk(threat)
             row_cells[1].text = max_risk if max_risk else ""
         
         doc.add_page_break()
@@ -1331,7 +1266,7 @@ class RiskAssessmentTool:
         # First find all threats that have data
         for threat in self.THREATS:
             if threat in self.threat_data and self.threat_data[threat]:
-                max_risk = self.get_max_risk_for_threat(threat)
+                max_risk = self.get_saved_max_risk(threat)
                 if max_risk:  # Only if a risk has been calculated
                     threats_with_data.append(threat)
         
@@ -1382,48 +1317,24 @@ class RiskAssessmentTool:
                     if 0 <= asset_index < len(self.ASSET_CATEGORIES):
                         category, asset_name = self.ASSET_CATEGORIES[asset_index]
 
-                        # Calculate likelihood and impact
-                        likelihood = self.calculate_likelihood_from_saved_data(threat_name, asset_key, asset_data)
-                        impact = self.calculate_impact_from_saved_data(asset_data)
-
                         # Only if we have valid data
-                        if asset_data and (likelihood >= 0 or impact >= 0):
-                            row_cells = table.add_row().cells
-
-                            # Asset name (important: must exactly match ASSET_CATEGORIES)
-                            row_cells[0].text = asset_name
-
-                            # Criteria (columns 0-4 correspond to Vulnerability, Detection Probability, Defense Capability, Operational Impact, Recovery)
-                            criteria_keys = ['0', '1', '2', '3', '4']
-                            for j, key in enumerate(criteria_keys):
-                                if key in asset_data:
-                                    score = asset_data[key]
-                                    # Specific format for import
-                                    row_cells[j + 1].text = f"Score {score}"
-                                else:
-                                    row_cells[j + 1].text = "N/A"
-
-                            # Calculate likelihood and impact if possible
-                            if likelihood >= 0:
-                                likelihood_cat = self.value_to_category(likelihood)
-                                row_cells[6].text = likelihood_cat
-                            else:
-                                row_cells[6].text = "N/A"
-                            
-                            if impact >= 0:
-                                impact_cat = self.value_to_category(impact)
-                                row_cells[7].text = impact_cat
-                            else:
-                                row_cells[7].text = "N/A"
-                            
-                            # Risk Level
-                            if likelihood >= 0 and impact >= 0:
-                                likelihood_cat = self.value_to_category(likelihood)
-                                impact_cat = self.value_to_category(impact)
-                                risk_level = self.RISK_MATRIX.get((likelihood_cat, impact_cat), "N/A")
-                                row_cells[8].text = risk_level
-                            else:
-                                row_cells[8].text = "N/A"
+                        if asset_data:
+                            # Likelihood, Impact and Risk levels of the saved scores
+                            likelihood_level = self.saved_scores_level(asset_data, ("0", "1", "2"))
+                            impact_level = self.saved_scores_level(asset_data, ("3", "4"))
+                            risk_level = RISK_INDEX_MATRIX[likelihood_level][impact_level]
+
+                            # Asset name (important: must exactly match ASSET_CATEGORIES), then the criteria
+                            # (columns 0-4: Vulnerability, Detection Probability, Defense Capability, Operational Impact, Recovery)
+                            # in the specific "Score N" format for import, then the computed levels
+                            row_texts = [asset_name]
+                            row_texts.extend(f"Score {asset_data[key]}" if key in asset_data else "N/A"
+                                             for key in ('0', '1', '2', '3', '4'))
+                            row_texts += (RISK_LEVELS[likelihood_level], RISK_LEVELS[impact_level], RISK_LEVELS[risk_level])
+
+                            # One row, its cells fetched once and filled in a single pass
+                            for cell, text in zip(table.add_row().cells, row_texts):
+                                cell.text = text
                             
                             assets_added += 1
                             
@@ -1453,12 +1364,13 @@ class RiskAssessmentTool:
         
         countermeasures = self.THREAT_COUNTERMEASURES[threat_name]
 
-        # Create table with 2 columns (Control #, Control Name)
-        table = doc.add_table(rows=1, cols=2)
+        # Create table with 2 columns (Control #, Control Name), all rows created at once
+        table = doc.add_table(rows=1 + len(countermeasures), cols=2)
         table.style = 'Table Grid'
+        rows = table.rows
         
         # Header
-        header_cells = table.rows[0].cells
+        header_cells = rows[0].cells
         header_cells[0].text = 'Control #'
         header_cells[1].text = 'Security Control'
 
@@ -1466,9 +1378,9 @@ class RiskAssessmentTool:
         for cell in header_cells:
             cell.paragraphs[0].runs[0].bold = True
 
-        # Add controls
-        for i, control in enumerate(countermeasures, 1):
-            row_cells = table.add_row().cells
+        # Fill controls
+        for i, (row, control) in enumerate(zip(rows[1:], countermeasures), 1):
+            row_cells = row.cells
             row_cells[0].text = str(i)
             row_cells[1].text = control
 
@@ -1480,34 +1392,31 @@ class RiskAssessmentTool:
             text = paragraph.text.strip()
             if text.startswith("Mission Type:"):
                 mission_type = text.replace("Mission Type:", "").strip()
-                # Update the dropdown if the mission type is in the list
-                if mission_type in self.MISSION_TYPES:
+                # Update the dropdown with the first non-empty mission type (in the list or not) and stop
+                if mission_type:
                     self.mission_type_var.set(mission_type)
-                elif mission_type:  # If not in the list but not empty, use the first as fallback
-                    self.mission_type_var.set(mission_type)
-                    break
+                    return
     def extract_threats_data_from_word(self, doc):
         """Extracts threat data from the Word document from the Detailed Threat Analysis section"""
         in_detailed_section = False
 
         # First, reset existing data to avoid conflicts
         self.threat_data = {}
+        self._threat_risk_cache.clear()
 
         # Improved method: scan all document elements in order
+        # (paragraph and table objects looked up by their XML element, built once)
+        paragraphs = {para._element: para for para in doc.paragraphs}
+        tables = {table._element: table for table in doc.tables}
         all_elements = []
-        for element in doc.element.body:
-            if element.tag.endswith('p'):  # Paragraph
-                para_text = ""
-                for para in doc.paragraphs:
-                    if para._element == element:
-                        para_text = para.text.strip()
-                        break
-                all_elements.append(('paragraph', para_text))
-            elif element.tag.endswith('tbl'):  # Table
-                for table in doc.tables:
-                    if table._element == element:
-                        all_elements.append(('table', table))
-                        break
+        for element in doc.element.body.iterchildren(WORD_P_TAG, WORD_TBL_TAG):
+            if element.tag == WORD_P_TAG:  # Paragraph
+                para = paragraphs.get(element)
+                all_elements.append(('paragraph', para.text.strip() if para is not None else ""))
+            else:  # Table
+                table = tables.get(element)
+                if table is not None:
+                    all_elements.append(('table', table))
 
         # Now process elements in order
         current_threat = None
@@ -1520,68 +1429,62 @@ class RiskAssessmentTool:
                 # Check if we are in the "Detailed Threat Analysis" section
                 if "Detailed Threat Analysis" in text:
                     in_detailed_section = True
-                    print("[OK] Found Detailed Threat Analysis section")
+                    log.debug("[OK] Found Detailed Threat Analysis section")
                     continue
 
                 # If we are in the detailed section, look for threat names
-                if in_detailed_section and text in self.THREATS:
+                if in_detailed_section and text in self.THREAT_INDEX:
                     current_threat = text
                     threat_table_count[current_threat] = 0
-                    print(f"[INFO] Found threat: {current_threat}")
+                    log.debug("[INFO] Found threat: %s", current_threat)
                     
             elif element_type == 'table' and current_threat and in_detailed_section:
                 table = element_data
                 threat_table_count[current_threat] += 1
                 table_number = threat_table_count[current_threat]
                 
-                print(f"[INFO] Processing table #{table_number} for threat: {current_threat}")
+                log.debug("[INFO] Processing table #%d for threat: %s", table_number, current_threat)
 
                 # Check table type by number of columns
                 if len(table.columns) == 9:
                     # Asset table
-                    print(f"   -> Asset table detected (9 columns)")
+                    log.debug("   -> Asset table detected (9 columns)")
                     self.extract_asset_table_data(table, current_threat)
                 elif len(table.columns) == 2:
                     # Controls table (ignore for data import)
-                    print(f"   -> Controls table detected (2 columns) - skipping")
+                    log.debug("   -> Controls table detected (2 columns) - skipping")
                 else:
-                    print(f"   -> Unknown table format ({len(table.columns)} columns) - skipping")
+                    log.debug("   -> Unknown table format (%d columns) - skipping", len(table.columns))
                     
-        print(f"[OK] Import completed. Found data for threats: {list(self.threat_data.keys())}")
+        log.info("[OK] Import completed. Found data for threats: %s", list(self.threat_data))
 
         # Debug: show imported data
-        for threat_name, threat_data in self.threat_data.items():
-            print(f"   {threat_name}: {len(threat_data)} assets")
+        if log.isEnabledFor(logging.DEBUG):
+            for threat_name, threat_data in self.threat_data.items():
+                log.debug("   %s: %d assets", threat_name, len(threat_data))
       
     def extract_asset_table_data(self, table, threat_name):
         """Extracts data from the asset table for a specific threat"""
         try:
-            print(f"[INFO] Extracting asset table data for threat: {threat_name}")
-            print(f"   Table dimensions: {len(table.rows)} rows x {len(table.columns)} columns")
+            log.debug("[INFO] Extracting asset table data for threat: %s", threat_name)
+            # Every cell text, read once
+            rows = word_table_texts(table)
+            log.debug("   Table dimensions: %d rows x %d columns", len(rows), len(table.columns))
 
             # Check table format (must have 9 columns)
             if len(table.columns) != 9:
-                print(f"[ERROR] Invalid table format: expected 9 columns, got {len(table.columns)}")
+                log.debug("[ERROR] Invalid table format: expected 9 columns, got %d", len(table.columns))
                 return
 
             # Check header to confirm it's the right table
-            header_row = table.rows[0]
-            expected_headers = ['Asset', 'Vulnerability', 'Detection Probability', 'Defense Capability', 
-                              'Operational Impact', 'Recovery Time', 'Likelihood', 'Impact', 'Risk Level']
-            
-            header_match = True
-            for i, expected in enumerate(expected_headers):
-                if i < len(header_row.cells):
-                    cell_text = header_row.cells[i].text.strip()
-                    if expected.lower() not in cell_text.lower():
-                        header_match = False
-                        break
+            header_match = all(expected in cell_text.lower()
+                               for expected, cell_text in zip(ASSET_TABLE_HEADERS_LOWER, rows[0]))
             
             if not header_match:
-                print(f"[ERROR] Header mismatch - not an asset table")
+                log.debug("[ERROR] Header mismatch - not an asset table")
                 return
             
-            print(f"[OK] Valid asset table confirmed")
+            log.debug("[OK] Valid asset table confirmed")
 
             # Initialized data for this threat if not exists
             if threat_name not in self.threat_data:
@@ -1589,35 +1492,32 @@ class RiskAssessmentTool:
 
             # Process each data row (skip header)
             data_rows_processed = 0
-            for row_idx, row in enumerate(table.rows[1:], 1):
+            for row_idx, cells in enumerate(rows[1:], 1):
                 try:
-                    cells = row.cells
                     if len(cells) < 9:
-                        print(f"[ERROR]  Row {row_idx}: insufficient cells ({len(cells)})")
+                        log.debug("[ERROR]  Row %d: insufficient cells (%d)", row_idx, len(cells))
                         continue
 
                     # Extract asset name from the first cell
-                    asset_name = cells[0].text.strip()
+                    asset_name = cells[0]
                     if not asset_name:
-                        print(f"[ERROR]  Row {row_idx}: empty asset name")
+                        log.debug("[ERROR]  Row %d: empty asset name", row_idx)
                         continue
                     
-                    print(f"   Processing asset: '{asset_name}'")
+                    log.debug("   Processing asset: '%s'", asset_name)
 
                     # Find the index of the corresponding asset in the standard categories
-                    asset_index = None
-                    for i, (category, name) in enumerate(self.ASSET_CATEGORIES):
-                        if name.lower() == asset_name.lower():
-                            asset_index = i + 1  # Index start from 1
-                            break
-                    
-                    if asset_index is None:
-                        print(f"[ERROR] Asset '{asset_name}' not found in standard categories")
+                    asset_lower = asset_name.lower()
+                    asset_index = self._asset_index_by_name.get(asset_lower)
+                    if asset_index is not None:
+                        asset_index += 1  # Index start from 1
+                    else:
+                        log.debug("[ERROR] Asset '%s' not found in standard categories", asset_name)
                         # Try partial matching
-                        for i, (category, name) in enumerate(self.ASSET_CATEGORIES):
-                            if asset_name.lower() in name.lower() or name.lower() in asset_name.lower():
+                        for i, name, name_lower in self._asset_names_lower:
+                            if asset_lower in name_lower or name_lower in asset_lower:
                                 asset_index = i + 1
-                                print(f"[OK] Found partial match: '{name}' -> using index {asset_index}")
+                                log.debug("[OK] Found partial match: '%s' -> using index %d", name, asset_index)
                                 break
                         
                         if asset_index is None:
@@ -1631,7 +1531,7 @@ class RiskAssessmentTool:
                     valid_scores = 0
 
                     for j in range(1, 6):  # Columns 1-5 for the 5 criteria
-                        cell_text = cells[j].text.strip()
+                        cell_text = cells[j]
 
                         # Various parsing formats
                         score = self.parse_score_from_cell(cell_text)
@@ -1639,26 +1539,26 @@ class RiskAssessmentTool:
                         if score is not None:
                             criteria_scores[str(j-1)] = str(score)  # Save as string with index 0-4
                             valid_scores += 1
-                            print(f"     Criterion {j-1}: {score}")
+                            log.debug("     Criterion %d: %d", j - 1, score)
                         else:
-                            print(f"     Criterion {j-1}: could not parse '{cell_text}'")
+                            log.debug("     Criterion %d: could not parse '%s'", j - 1, cell_text)
 
                     # Save only if we have at least 3 valid criteria (to calculate likelihood/impact)
                     if valid_scores >= 3:
                         self.threat_data[threat_name][asset_key] = criteria_scores
                         data_rows_processed += 1
-                        print(f"[OK] Saved data for asset {asset_index} ({asset_name}): {valid_scores} criteria")
+                        log.debug("[OK] Saved data for asset %d (%s): %d criteria", asset_index, asset_name, valid_scores)
                     else:
-                        print(f"[ERROR] Insufficient valid criteria ({valid_scores}/5) for asset {asset_name}")
+                        log.debug("[ERROR] Insufficient valid criteria (%d/5) for asset %s", valid_scores, asset_name)
 
                 except Exception as e:
-                    print(f"[ERROR] Error processing row {row_idx}: {e}")
+                    log.error("[ERROR] Error processing row %d: %s", row_idx, e)
                     continue
             
-            print(f"[OK] Processed {data_rows_processed} valid asset rows for threat '{threat_name}'")
+            log.debug("[OK] Processed %d valid asset rows for threat '%s'", data_rows_processed, threat_name)
                     
         except Exception as e:
-            print(f"[ERROR] Error extracting asset table data for {threat_name}: {e}")
+            log.error("[ERROR] Error extracting asset table data for %s: %s", threat_name, e)
     
     def parse_score_from_cell(self, cell_text):
         """Extracts a score from a Word table cell with various formats"""
@@ -1667,11 +1567,21 @@ class RiskAssessmentTool:
         
         text = cell_text.strip()
 
+        # Fast path: "X" or "Score X" with a 1-5 score, in one match
+        match = SCORE_CELL_RE.match(text)
+        if match:
+            return int(match.group(1))
+
+        # Format 4: "N/A" or empty
+        lower = text.lower()
+        if lower in NO_SCORE_TEXTS:
+            return None
+
         # Format 1: "Score X"
-        if "score" in text.lower():
+        if "score" in lower:
             try:
                 # Remove "Score" and take the number
-                score_str = text.lower().replace("score", "").strip()
+                score_str = lower.replace("score", "").strip()
                 return int(score_str)
             except ValueError:
                 pass
@@ -1683,14 +1593,9 @@ class RiskAssessmentTool:
                 return score
 
         # Format 3: Number in a longer string
-        import re
-        numbers = re.findall(r'\b([1-5])\b', text)
-        if numbers:
-            return int(numbers[0])
-
-        # Format 4: "N/A" or empty
-        if text.lower() in ['n/a', 'na', '-', '']:
-            return None
+        match = SCORE_RE.search(text)
+        if match:
+            return int(match.group(1))
         
         return None
 
@@ -1729,50 +1634,51 @@ class RiskAssessmentTool:
         table.style = 'Table Grid'
         table.alignment = WD_TABLE_ALIGNMENT.CENTER
 
+        # Font color of each risk level, built once per table
+        risk_colors = {level: RGBColor(*rgb) for level, rgb in RISK_FONT_RGB.items()}
+
         # Header
         # Empty cell in top left
-        table.rows[0].cells[0].text = "Impact \n Likelihood"
-        table.rows[0].cells[0].paragraphs[0].runs[0].bold = True
+        header_cells = table.rows[0].cells
+        header_cells[0].text = "Impact \n Likelihood"
+        header_cells[0].paragraphs[0].runs[0].bold = True
 
         # Header columns (Impact)
         for j, level in enumerate(levels, 1):
-            table.rows[0].cells[j].text = level
-            table.rows[0].cells[j].paragraphs[0].runs[0].bold = True
+            header_cells[j].text = level
+            header_cells[j].paragraphs[0].runs[0].bold = True
         
         # Header rows (Likelihood) and matrix content
         for i, likelihood in enumerate(levels, 1):
+            row_cells = table.rows[i].cells
             # Header row
-            table.rows[i].cells[0].text = likelihood
-            table.rows[i].cells[0].paragraphs[0].runs[0].bold = True
+            row_cells[0].text = likelihood
+            row_cells[0].paragraphs[0].runs[0].bold = True
 
             # Matrix content
             for j, impact in enumerate(levels, 1):
-                risk_level = self.RISK_MATRIX.get((likelihood, impact), "")
-                table.rows[i].cells[j].text = risk_level
+                risk_level = RISK_MATRIX.get((likelihood, impact), "")
+                cell = row_cells[j]
+                cell.text = risk_level
 
                 # Colors the cells based on risk level
-                cell = table.rows[i].cells[j]
-                if risk_level == "Very High":
-                    # Dark Red
-                    cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(139, 0, 0)
-                elif risk_level == "High":
-                    # Red
-                    cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(220, 20, 60)
-                elif risk_level == "Medium":
-                    # Orange
-                    cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 140, 0)
-                elif risk_level == "Low":
-                    # Dark Yellow
-                    cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(184, 134, 11)
-                elif risk_level == "Very Low":
-                    # Green
-                    cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(34, 139, 34)
+                color = risk_colors.get(risk_level)
+                if color is not None:
+                    cell.paragraphs[0].runs[0].font.color.rgb = color
 
         doc.add_paragraph()  # Space after the table
 
     def show_help(self):
-        """Show help window with criteria descriptions"""
-        help_window = tk.Toplevel(self.root)
+        """Show help window with criteria descriptions (built on first open, then hidden and reused)"""
+        help_window = self._help_window
+        if help_window is not None and help_window.winfo_exists():
+            help_window.deiconify()
+            help_window.lift()
+            help_window.grab_set()
+            help_window.focus_set()
+            return
+
+        help_window = self._help_window = tk.Toplevel(self.root)
         help_window.title("Assessment Criteria - Help")
         help_window.geometry("1200x700")  # Increased height to accommodate tool explanation
         help_window.configure(bg=self.COLORS['white'])
@@ -1784,7 +1690,7 @@ class RiskAssessmentTool:
         
         # Title
         title_label = tk.Label(help_window, text="Risk Assessment Criteria Descriptions", 
-                              font=('Segoe UI',  16, 'bold'),
+                              font=self.get_font(16, 'bold'),
                               bg=self.COLORS['white'], fg=self.COLORS['dark'])
         title_label.pack(pady=(20, 15))
         
@@ -1813,27 +1719,19 @@ class RiskAssessmentTool:
         header_frame.grid_columnconfigure(0, weight=0, minsize=250)
         header_frame.grid_columnconfigure(1, weight=1)
         
-        criterion_header = tk.Label(header_frame, text="Criterion", font=('Segoe UI', 12, 'bold'),
+        criterion_header = tk.Label(header_frame, text="Criterion", font=self.get_font(12, 'bold'),
                                    bg=self.COLORS['primary'], fg=self.COLORS['white'], anchor='w',
                                    padx=15, pady=10)
         criterion_header.grid(row=0, column=0, sticky='ew')
         
-        desc_header = tk.Label(header_frame, text="Description", font=('Segoe UI', 12, 'bold'),
+        desc_header = tk.Label(header_frame, text="Description", font=self.get_font(12, 'bold'),
                               bg=self.COLORS['primary'], fg=self.COLORS['white'], anchor='w',
                               padx=15, pady=10)
         desc_header.grid(row=0, column=1, sticky='ew')
         
-        # Criteria descriptions
-        criteria_help = {
-            "Vulnerability Level": "Measures the presence and severity of known security vulnerabilities in the system. Lower scores indicate well-patched systems with no known vulnerabilities, while higher scores indicate systems with actively exploitable vulnerabilities.",
-            "Detection Probability": "Evaluates the likelihood that malicious activities will be detected by monitoring and security systems. Higher scores indicate comprehensive real-time monitoring with automated threat detection, while lower scores indicate limited or no detection capabilities.",
-            "Defense Capability": "Assesses comprehensive defense including effective mitigations, restricted access controls, and administrative privilege requirements. This encompasses countermeasures, access protection measures, and privilege management systems working together as a unified defense strategy.",
-            "Operational Impact": "Measures the potential impact on mission operations if the threat materializes. This considers service disruption, data loss, and effects on critical mission functions.",
-            "Recovery Time": "Evaluates the time and resources required to restore normal operations after a security incident. This includes backup systems, recovery procedures, and business continuity planning."
-        }
         
         # Add criteria rows
-        for i, (criterion, description) in enumerate(criteria_help.items()):
+        for i, (criterion, description) in enumerate(self.CRITERIA_HELP.items()):
             # Row frame
             row_color = self.COLORS['light'] if i % 2 == 0 else self.COLORS['white']
             row_frame = tk.Frame(table_frame, bg=row_color, relief='ridge', bd=1)
@@ -1845,14 +1743,14 @@ class RiskAssessmentTool:
             
             # Criterion name (left column)
             criterion_label = tk.Label(row_frame, text=criterion, 
-                                      font=('Segoe UI', 11, 'bold'),
+                                      font=self.get_font(11, 'bold'),
                                       bg=row_color, fg=self.COLORS['dark'], anchor='nw',
                                       padx=15, pady=8, wraplength=220, justify='left')
             criterion_label.grid(row=0, column=0, sticky='new')
             
             # Description (right column)
             desc_label = tk.Label(row_frame, text=description,
-                                 font=('Segoe UI', 11),
+                                 font=self.get_font(11),
                                  bg=row_color, fg='#495057', anchor='nw',
                                  padx=15, pady=8, wraplength=800, justify='left')
             desc_label.grid(row=0, column=1, sticky='new')
@@ -1863,7 +1761,7 @@ class RiskAssessmentTool:
         
         # Tool explanation title
         explanation_title = tk.Label(scrollable_frame, text="How the Risk Assessment Tool Works", 
-                                    font=('Segoe UI', 14, 'bold'),
+                                    font=self.get_font(14, 'bold'),
                                     bg=self.COLORS['white'], fg=self.COLORS['primary'])
         explanation_title.pack(pady=(10, 15), padx=15, anchor='w')
         
@@ -1917,7 +1815,7 @@ class RiskAssessmentTool:
    • Use the assessment results to prioritize security investments and controls"""
         
         explanation_label = tk.Label(explanation_frame, text=explanation_text,
-                                   font=('Segoe UI', 10),
+                                   font=self.get_font(10),
                                    bg=self.COLORS['light'], fg='#495057', anchor='nw',
                                    padx=20, pady=15, wraplength=1100, justify='left')
         explanation_label.pack(fill='both', expand=True)
@@ -1926,22 +1824,18 @@ class RiskAssessmentTool:
         canvas.pack(side="left", fill="both", expand=True, padx=(0, 5))
         scrollbar.pack(side="right", fill="y")
         
-        # Setup global mouse wheel scrolling for the help window
-        self.setup_global_mousewheel(scrollable_frame, canvas)
-        
         # Focus on help window
         help_window.focus_set()
+        help_window.protocol("WM_DELETE_WINDOW", self.hide_help_window)
+
+    def hide_help_window(self):
+        """Hide the help window instead of destroying it, so the next open reuses it"""
+        self._help_window.grab_release()
+        self._help_window.withdraw()
         
     def category_to_value(self, category):
         """Converts a category string to a numeric value (0-1 range)"""
-        category_mapping = {
-            'Very Low': 0.05,
-            'Low': 0.1,
-            'Medium': 0.4,
-            'High': 0.7,
-            'Very High': 0.9
-        }
-        return category_mapping.get(category, 0.5)
+        return CATEGORY_VALUES.get(category, 0.5)
     
     def likelihood_to_base_value(self, likelihood_val):
         """Converts likelihood value to base assessment value (1-5 range)"""
@@ -1961,16 +1855,11 @@ class RiskAssessmentTool:
         
         try:
             # First, extract mission type from paragraphs
-            for paragraph in doc.paragraphs:
-                text = paragraph.text.strip()
-                if text.startswith("Mission Type:"):
-                    mission_type = text.replace("Mission Type:", "").strip()
-                    # Update the dropdown if the mission type is in the list
-                    if mission_type in self.MISSION_TYPES:
-                        self.mission_type_var.set(mission_type)
-                    elif mission_type:
-                        # If not in the list, add it temporarily for this session
-                        self.mission_type_var.set(mission_type)
+            # (if not in the list, it is used temporarily for this session)
+            self.extract_mission_type_from_word(doc)
+            
+            # Paragraphs of each threat's detailed section, collected in one pass
+            threat_sections = self.collect_threat_sections(doc)
             
             # Look for tables in the document
             for table in doc.tables:
@@ -1997,24 +1886,19 @@ class RiskAssessmentTool:
                         if threat_col >= 0 and prob_col >= 0:
                             # Parse data rows
                             for row in table.rows[1:]:  # Skip header
-                                if len(row.cells) > max(threat_col, prob_col):
-                                    threat_name = row.cells[threat_col].text.strip()
-                                    probability = row.cells[prob_col].text.strip()
+                                row_cells = row.cells
+                                if len(row_cells) > max(threat_col, prob_col):
+                                    threat_name = row_cells[threat_col].text.strip()
+                                    probability = row_cells[prob_col].text.strip()
                                     
                                     # Map probability values
-                                    prob_mapping = {
-                                        'Very Low': 'Very Low', 'Low': 'Low', 'Medium': 'Medium',
-                                        'High': 'High', 'Very High': 'Very High',
-                                        'VL': 'Very Low', 'L': 'Low', 'M': 'Medium',
-                                        'H': 'High', 'VH': 'Very High'
-                                    }
-                                    
-                                    probability = prob_mapping.get(probability, probability)
+                                    probability = LEGACY_PROBABILITY_ALIASES.get(probability, probability)
                                     
                                     # Only add if it's a valid threat
-                                    if threat_name in self.THREATS and probability in ['Very Low', 'Low', 'Medium', 'High', 'Very High']:
+                                    if threat_name in self.THREAT_INDEX and probability in RISK_LEVEL_INDEX:
                                         # Extract asset categories from detailed analysis
-                                        asset_categories = self.extract_asset_categories_from_doc(doc, threat_name)
+                                        asset_categories = self.extract_asset_categories_from_section(
+                                            threat_sections.get(threat_name, ()), threat_name)
                                         
                                         threats_data[threat_name] = {
                                             'likelihood': probability,
@@ -2026,37 +1910,56 @@ class RiskAssessmentTool:
         
         return threats_data
     
-    def extract_asset_categories_from_doc(self, doc, threat_name):
-        """Extract asset categories mentioned for a specific threat"""
-        asset_categories = []
+    def collect_threat_sections(self, doc):
+        """Non-empty paragraph texts of each threat's section: from the first paragraph naming the threat
+        up to the next threat name or 'Security Controls' paragraph"""
+        sections = {}
+        current_threat = None  # Threat whose section is open
         
-        try:
-            # Look for the threat in the document text
-            in_threat_section = False
+        for paragraph in doc.paragraphs:
+            text = paragraph.text.strip()
             
-            for paragraph in doc.paragraphs:
-                text = paragraph.text.strip()
-                
-                # Check if we're in the threat section
-                if text == threat_name:
-                    in_threat_section = True
+            if current_threat is not None:
+                if text == current_threat:
                     continue
-                elif in_threat_section and text in self.THREATS:
-                    # We've moved to another threat section
-                    break
-                elif in_threat_section and text.startswith('Security Controls'):
-                    # End of threat section
+                elif text in self.THREAT_INDEX or text.startswith('Security Controls'):
+                    # We've moved to another threat section / end of threat section
+                    current_threat = None
+                elif text:
+                    sections[current_threat].append(text)
+                    continue
+            
+            # Check if a threat section starts here (only its first mention counts)
+            if text in self.THREAT_INDEX and text not in sections:
+                current_threat = text
+                sections[current_threat] = []
+        
+        return sections
+    
+    def extract_asset_categories_from_section(self, section_texts, threat_name):
+        """Extract asset categories mentioned for a specific threat in its section texts"""
+        asset_categories = []
+        seen = set()
+        # Categories not mentioned yet; once all are found the remaining texts are skipped
+        pending = self._asset_categories_lower
+        
+        try:
+            for text in section_texts:
+                # Look for asset categories in the text
+                text_lower = text.lower()
+                still_pending = []
+                for entry in pending:
+                    main_cat, sub_cat, main_lower, sub_lower = entry
+                    if main_lower in text_lower or sub_lower in text_lower:
+                        for name in (main_cat, sub_cat):
+                            if name not in seen:
+                                seen.add(name)
+                                asset_categories.append(name)
+                    else:
+                        still_pending.append(entry)
+                pending = still_pending
+                if not pending:
                     break
-                
-                # If we're in the threat section, look for asset mentions
-                if in_threat_section and text:
-                    # Look for asset categories in the text
-                    for main_cat, sub_cat in self.ASSET_CATEGORIES:
-                        if main_cat.lower() in text.lower() or sub_cat.lower() in text.lower():
-                            if main_cat not in asset_categories:
-                                asset_categories.append(main_cat)
-                            if sub_cat not in asset_categories:
-                                asset_categories.append(sub_cat)
         
         except Exception as e:
             print(f"Error extracting asset categories for {threat_name}: {e}")
@@ -2069,6 +1972,7 @@ class RiskAssessmentTool:
 
 def main():
     """Main function"""
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
     root = tk.Tk()
     app = RiskAssessmentTool(root)
     root.mainloop()